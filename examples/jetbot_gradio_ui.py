@@ -10,19 +10,180 @@ Usage:
 Make sure the Jetbot server is running before connecting.
 """
 
+import os
+
+try:
+    import cv2
+except ImportError:
+    # OpenCV is optional on the UI client; NumPy fallbacks are used below
+    cv2 = None
+
 import gradio as gr
+import logging
 import numpy as np
+import queue
+import threading
 import time
+import zlib
+from logging.handlers import QueueHandler, QueueListener
+from collections import deque
+from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 from remote_robot import JetbotRemote, JetbotConfig
 
 
+# Set JETBOT_ASSUME_RGB=1 if the server already delivers RGB frames,
+# skipping the per-frame BGR->RGB conversion entirely.
+ASSUME_RGB = bool(os.getenv("JETBOT_ASSUME_RGB"))
+
+# Set JETBOT_DEBUG=1 to enable verbose motor debugging: before/after
+# observations and console dumps on every action (adds two extra RPyC
+# round-trips and a 100 ms settle per click).
+DEBUG_MOTORS = bool(os.getenv("JETBOT_DEBUG"))
+
+# Optional push-stream live view. Point JETBOT_MJPEG_URL at the server's
+# MJPEG endpoint (start the server with --mjpeg-port) and the browser
+# renders frames as they arrive, with no RPyC polling and no stale-frame
+# backpressure. Motor control stays on RPyC either way.
+MJPEG_URL = os.getenv("JETBOT_MJPEG_URL")
+
+# Log records are queued and drained by a daemon thread, so console
+# flushes never block the Gradio worker that is talking to the robot.
+logger = logging.getLogger("jetbot_ui")
+logger.setLevel(logging.DEBUG if DEBUG_MOTORS else logging.INFO)
+_log_queue: queue.Queue = queue.Queue()
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
 # Global state
 robot: Optional[JetbotRemote] = None
 live_feed_active = False
-last_auto_refresh_ts = 0.0
+
+# Debug frame history using observation indexing: unique frames are stored
+# once in _history_frames, and the timeline is a deque of indices into it.
+# Consecutive duplicate frames (robot stationary) cost one int, not one
+# image copy.
+_HISTORY_MAX_FRAMES = 64
+_history_frames: list = []
+_history_indices: deque = deque(maxlen=256)
+_history_lock = threading.Lock()
+_last_frame_digest: Optional[int] = None
+
+
+def _record_frame(image: Optional[np.ndarray]) -> None:
+    """Append a frame to the debug history, deduplicating repeats."""
+    global _last_frame_digest
+
+    if image is None:
+        return
+
+    digest = zlib.crc32(np.ascontiguousarray(image).tobytes())
+    with _history_lock:
+        if _history_frames and digest == _last_frame_digest:
+            # Same pixels as the newest unique frame: store only its index
+            _history_indices.append(len(_history_frames) - 1)
+            return
+
+        if len(_history_frames) >= _HISTORY_MAX_FRAMES:
+            _history_frames.clear()
+            _history_indices.clear()
+
+        _history_frames.append(image.copy())
+        _history_indices.append(len(_history_frames) - 1)
+        _last_frame_digest = digest
+
+
+def save_frame_history(n: int = 16) -> str:
+    """Write the most recent frames from the debug history to disk."""
+    with _history_lock:
+        indices = list(_history_indices)[-int(n):]
+        frames = list(_history_frames)
+
+    if not indices:
+        return "No frames in history"
+
+    out_dir = Path("debug_frames")
+    out_dir.mkdir(exist_ok=True)
+    for i, idx in enumerate(indices):
+        frame = frames[idx]
+        path = out_dir / f"frame_{i:03d}.png"
+        if cv2 is not None:
+            cv2.imwrite(str(path), cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+        else:
+            np.save(str(path.with_suffix(".npy")), frame)
+
+    return (
+        f"Saved {len(indices)} frames ({len(frames)} unique in buffer) "
+        f"to {out_dir}/"
+    )
+
+
+# Serializes access to the RPyC connection across Gradio worker threads
+# and the frame producer. Commands block briefly for their turn; frame
+# polls use try-acquire and skip instead of piling up behind a slow call.
+_robot_call_lock = threading.Lock()
+
+# Latest-frame slot filled by a background producer thread. Consumers wait
+# on the condition variable and wake as soon as a new frame is published,
+# instead of blocking on a full RPyC round-trip per update.
+_frame_lock = threading.Lock()
+_frame_cv = threading.Condition(_frame_lock)
+_latest_frame: tuple = (None, "No observation yet", {})
+_frame_thread: Optional[threading.Thread] = None
+# Event instead of a polled bool: idle waits become interruptible, so
+# shutdown doesn't stall for up to a full sleep interval
+_producer_stop = threading.Event()
+_producer_stop.set()
+
+
+def _frame_producer():
+    """Continuously pull observations into the latest-frame slot."""
+    global _latest_frame
+
+    while not _producer_stop.is_set():
+        if not live_feed_active or robot is None:
+            _producer_stop.wait(0.1)
+            continue
+
+        try:
+            image, status, feedback = get_observation_once()
+        except Exception:
+            _producer_stop.wait(0.25)
+            continue
+
+        if image is None:
+            # Busy-skip (another robot call holds the lock) or transient
+            # error: publishing it would blank the live display, and
+            # retrying immediately would spin hot for the lock's whole
+            # hold time. Back off briefly instead, like the except path.
+            _producer_stop.wait(0.05)
+            continue
+
+        with _frame_cv:
+            _latest_frame = (image, status, feedback)
+            _frame_cv.notify_all()
+
+
+def _start_frame_producer():
+    """Start the background observation producer (idempotent)."""
+    global _frame_thread
+
+    if _frame_thread is not None and _frame_thread.is_alive():
+        return
+
+    _producer_stop.clear()
+    _frame_thread = threading.Thread(target=_frame_producer, daemon=True)
+    _frame_thread.start()
+
+
+def _stop_frame_producer():
+    """Wake and stop the background producer without a long join."""
+    _producer_stop.set()
+    if _frame_thread is not None:
+        _frame_thread.join(timeout=0.1)
 
 
 def connect_robot(host: str, port: int) -> tuple[str, str]:
@@ -47,6 +208,7 @@ def connect_robot(host: str, port: int) -> tuple[str, str]:
         robot.connect()
 
         if robot.is_connected:
+            _start_frame_producer()
             return f"Connected to Jetbot at {host}:{port}", "success"
         else:
             return "Connection failed", "error"
@@ -58,15 +220,18 @@ def connect_robot(host: str, port: int) -> tuple[str, str]:
 
 def disconnect_robot() -> tuple[str, str]:
     """Disconnect from the Jetbot robot."""
-    global robot, live_feed_active, last_auto_refresh_ts
+    global robot, live_feed_active, _camera_key
 
     try:
         if robot is None:
             return "Not connected", "warning"
 
+        # A different server may use a different observation key
+        _camera_key = None
+
         # Stop live feed if active
         live_feed_active = False
-        last_auto_refresh_ts = 0.0
+        _stop_frame_producer()
 
         robot.disconnect()
         robot = None
@@ -76,8 +241,26 @@ def disconnect_robot() -> tuple[str, str]:
         return f"Error during disconnect: {str(e)}", "error"
 
 
+def _timestamp() -> str:
+    """Monotonic timestamp string for status lines.
+
+    Avoids the per-call datetime.now().strftime() allocation and
+    gettimeofday syscall on the hot path; the verbose debug console output
+    keeps wall-clock formatting.
+    """
+    return f"{time.perf_counter():.3f}s"
+
+
+# Reused output buffer for _prepare_image_for_display: at a steady frame
+# size the conversion writes into the same allocation every frame instead
+# of churning the allocator. Safe because frames flow through one producer.
+_display_buf: Optional[np.ndarray] = None
+
+
 def _prepare_image_for_display(image: Optional[np.ndarray]) -> Optional[np.ndarray]:
     """Convert network BGR images into uint8 RGB arrays for Gradio."""
+    global _display_buf
+
     if image is None:
         return None
 
@@ -85,19 +268,59 @@ def _prepare_image_for_display(image: Optional[np.ndarray]) -> Optional[np.ndarr
     if array.dtype != np.uint8:
         array = np.clip(array, 0, 255).astype(np.uint8)
 
-    if array.ndim == 3 and array.shape[2] == 3:
-        # Convert from OpenCV BGR to RGB for correct display colors
-        array = array[:, :, ::-1]
+    if array.ndim == 3 and array.shape[2] == 3 and not ASSUME_RGB:
+        # Convert from OpenCV BGR to RGB for correct display colors.
+        # cv2.cvtColor produces a contiguous buffer in one pass, unlike the
+        # array[:, :, ::-1] view which forces Gradio to copy again on encode.
+        if _display_buf is None or _display_buf.shape != array.shape:
+            _display_buf = np.empty_like(array)
+        if cv2 is not None:
+            cv2.cvtColor(np.ascontiguousarray(array), cv2.COLOR_BGR2RGB, dst=_display_buf)
+        else:
+            # No OpenCV: copy plane by plane into the reused buffer. Each
+            # channel is written with a fixed stride, which is considerably
+            # faster than materializing the strided reversed-slice view.
+            _display_buf[..., 0] = array[..., 2]
+            _display_buf[..., 1] = array[..., 1]
+            _display_buf[..., 2] = array[..., 0]
+        return _display_buf
 
     return array
 
 
+# Candidate observation keys for the camera frame, and the winning key
+# cached after the first hit. The server's key never changes within a
+# session, so subsequent frames do one dict lookup instead of a probe.
+_CAMERA_KEYS = ("observation.images.main", "main", "camera")
+_camera_key: Optional[str] = None
+
+
 def _extract_camera_image(obs: Dict[str, Any]) -> Optional[np.ndarray]:
     """Extract the best-guess camera frame from a robot observation."""
-    for key in ("observation.images.main", "main", "camera"):
-        if key in obs:
-            return _prepare_image_for_display(obs[key])
-    return None
+    global _camera_key
+
+    if _camera_key is not None:
+        value = obs.get(_camera_key)
+    else:
+        value = None
+        for key in _CAMERA_KEYS:
+            if key in obs:
+                _camera_key = key
+                value = obs[key]
+                break
+
+    if value is None:
+        return None
+
+    if isinstance(value, (bytes, bytearray)):
+        if cv2 is None:
+            # Cannot decode compressed frames without OpenCV
+            return None
+        # Compressed JPEG from the server; decode locally
+        value = cv2.imdecode(
+            np.frombuffer(value, np.uint8), cv2.IMREAD_COLOR
+        )
+    return _prepare_image_for_display(value)
 
 
 def get_observation_once() -> tuple[Optional[np.ndarray], str, Dict[str, Any]]:
@@ -107,11 +330,18 @@ def get_observation_once() -> tuple[Optional[np.ndarray], str, Dict[str, Any]]:
     if robot is None or not robot.is_connected:
         return None, "Not connected to robot", {}
 
+    if not _robot_call_lock.acquire(blocking=False):
+        # Another robot call is in flight; skip rather than queue up
+        return None, "Robot busy, refresh skipped", {}
+
     try:
-        obs = robot.get_observation()
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        # Prefer the compressed-frame path: the camera arrives as JPEG bytes
+        # instead of a base64 string, cutting network bandwidth per frame
+        obs = robot.get_observation_jpeg()
+        timestamp = _timestamp()
 
         camera_image = _extract_camera_image(obs)
+        _record_frame(camera_image)
 
         # Extract motor values
         motor_feedback = {
@@ -124,6 +354,8 @@ def get_observation_once() -> tuple[Optional[np.ndarray], str, Dict[str, Any]]:
 
     except Exception as e:
         return None, f"Error: {str(e)}", {}
+    finally:
+        _robot_call_lock.release()
 
 
 def send_action(left_motor: float, right_motor: float) -> tuple[str, Dict[str, Any]]:
@@ -139,55 +371,56 @@ def send_action(left_motor: float, right_motor: float) -> tuple[str, Dict[str, A
             "right_motor.value": right_motor,
         }
 
-        # DEBUG: Log the action being sent
-        print(f"\n{'='*60}")
-        print(f"[CLIENT] Sending action at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-        print(f"[CLIENT] Action dict: {action}")
-        print(f"[CLIENT] Robot connected: {robot.is_connected}")
-
-        # Get observation BEFORE sending action
-        obs_before = robot.get_observation()
-        motor_values_before = {
-            "left_motor.value": obs_before.get("left_motor.value", 0.0),
-            "right_motor.value": obs_before.get("right_motor.value", 0.0),
-        }
-        print(f"[CLIENT] Motor values BEFORE action:")
-        for key, val in motor_values_before.items():
-            print(f"  {key}: {val:.3f}")
+        motor_values_before = {}
 
-        # Send action
-        result = robot.send_action(action)
-        print(f"[CLIENT] send_action returned: {result}")
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        # Take our turn on the connection; commands wait rather than drop
+        with _robot_call_lock:
+            if DEBUG_MOTORS:
+                # DEBUG: Log the action being sent
+                logger.debug(
+                    "[CLIENT] Sending action at %s",
+                    datetime.now().strftime('%H:%M:%S.%f')[:-3],
+                )
+                logger.debug("[CLIENT] Action dict: %s", action)
 
-        # Get updated observation after action
-        time.sleep(0.1)  # Small delay for motors to respond
-        obs = robot.get_observation()
+                # Get motor state BEFORE sending action (packed float32 pair,
+                # no camera payload)
+                motor_values_before = robot.get_motor_state()
+                logger.debug(
+                    "[CLIENT] Motor values BEFORE action: %s", motor_values_before
+                )
 
-        # Extract motor values
-        motor_feedback = {
-            "left_motor.value": obs.get("left_motor.value", 0.0),
-            "right_motor.value": obs.get("right_motor.value", 0.0),
-        }
+            # Send action
+            result = robot.send_action(action)
+        timestamp = _timestamp()
 
-        # Compare before and after
-        print(f"[CLIENT] Motor values AFTER action:")
-        for key, val in motor_feedback.items():
-            before_val = motor_values_before.get(key, 0.0)
-            delta = val - before_val
-            print(f"  {key}: {val:.3f} (delta: {delta:+.3f})")
-        print(f"{'='*60}\n")
+        # The server acks with the post-write motor state, so no settle
+        # delay or follow-up observation is needed before trusting feedback.
+        motor_feedback = {
+            "left_motor.value": result.get("left_motor.value", left_motor),
+            "right_motor.value": result.get("right_motor.value", right_motor),
+        } if result else dict(action)
+
+        if DEBUG_MOTORS:
+            logger.debug("[CLIENT] send_action returned: %s", result)
+
+            # Compare before and after
+            for key, val in motor_feedback.items():
+                before_val = motor_values_before.get(key, 0.0)
+                logger.debug(
+                    "[CLIENT] %s: %.3f (delta: %+.3f)", key, val, val - before_val
+                )
 
-        # Show the values being sent for debugging
+        # Show the values being sent
         values_str = f"left: {left_motor:.2f}, right: {right_motor:.2f}"
-        status = f"Action sent at {timestamp}\nValues: {values_str}\nCheck console for detailed debug info"
+        status = f"Action sent at {timestamp}\nValues: {values_str}"
+        if DEBUG_MOTORS:
+            status += "\nCheck console for detailed debug info"
 
         return status, motor_feedback
 
     except Exception as e:
-        print(f"[CLIENT] ERROR: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[CLIENT] ERROR: %s", e)
         return f"Error: {str(e)}", {}
 
 
@@ -233,6 +466,11 @@ with gr.Blocks(title="Jetbot Remote Control") as demo:
             # Camera display
             with gr.Group():
                 gr.Markdown("### Camera Feed")
+                if MJPEG_URL:
+                    gr.HTML(
+                        f'<img src="{MJPEG_URL}" alt="Live camera stream" '
+                        f'style="width: 100%; max-height: 400px; object-fit: contain;">'
+                    )
                 camera_display = gr.Image(
                     label="Camera Observation",
                     type="numpy",
@@ -259,6 +497,10 @@ with gr.Blocks(title="Jetbot Remote Control") as demo:
                     interactive=False
                 )
 
+                save_frames_btn = gr.Button(
+                    "Save Frame History", variant="secondary", size="sm"
+                )
+
         # Right column: Motor Controls and Feedback
         with gr.Column(scale=1):
             # Motor controls
@@ -308,106 +550,128 @@ with gr.Blocks(title="Jetbot Remote Control") as demo:
     def handle_stop():
         return stop_motors()
 
-    # Quick control handlers
-    def handle_forward():
-        return send_action(0.15, 0.15)
-
-    def handle_backward():
-        return send_action(-0.15, -0.15)
-
-    def handle_turn_left():
-        return send_action(-0.15, 0.15)
-
-    def handle_turn_right():
-        return send_action(0.15, -0.15)
+    # Quick control handler. Batched so that rapid clicks coalesce into a
+    # single invocation; only the most recent (left, right) pair is sent,
+    # dropping the stale intermediate commands instead of queueing one RPyC
+    # round-trip per click.
+    def handle_move(lefts, rights):
+        status, feedback = send_action(float(lefts[-1]), float(rights[-1]))
+        n = len(lefts)
+        return [status] * n, [feedback] * n
 
     # Auto-refresh mechanism
     def handle_live_feed_toggle(enabled: bool):
         """Enable/disable live feed polling."""
-        global live_feed_active, last_auto_refresh_ts
+        global live_feed_active
 
         if enabled and (robot is None or not robot.is_connected):
             live_feed_active = False
             return gr.update(value=False), "Connect to the robot before enabling auto-refresh"
 
         live_feed_active = bool(enabled)
-        if enabled:
-            last_auto_refresh_ts = 0.0
 
         message = "Auto-refresh enabled" if enabled else "Auto-refresh disabled"
         return gr.update(value=enabled), message
 
-    def auto_refresh_feed(auto_refresh_enabled: bool, interval_seconds: float):
-        """Called periodically when auto-refresh is enabled."""
-        global last_auto_refresh_ts
+    def stream_frames(auto_refresh_enabled: bool, interval_seconds: float):
+        """Stream frames to the UI while auto-refresh is enabled.
 
+        Generator bound to the toggle: each new frame published by the
+        producer thread wakes the condition variable and is pushed to the
+        browser immediately (SSE streaming), so there are no idle polling
+        ticks and no per-tick Gradio round-trips.
+        """
         if not auto_refresh_enabled:
-            return [gr.update(), gr.update(), gr.update()]
+            return
 
         wait_time = max(0.25, float(interval_seconds))
-        now = time.time()
-        if now - last_auto_refresh_ts < wait_time:
-            return [gr.update(), gr.update(), gr.update()]
-
-        last_auto_refresh_ts = now
-        return handle_get_observation()
+        last_frame = None
+        while live_feed_active:
+            with _frame_cv:
+                _frame_cv.wait(timeout=wait_time)
+                current = _latest_frame
+            if current is last_frame:
+                # Wait timed out without a new frame: gr.skip() suppresses
+                # the SSE payload and client re-render entirely, instead of
+                # shipping three no-op gr.update() objects
+                yield [gr.skip(), gr.skip(), gr.skip()]
+                continue
+            last_frame = current
+            yield list(current)
 
     # Connect events
     connect_btn.click(
         fn=handle_connect,
         inputs=[host_input, port_input],
-        outputs=[connection_status]
+        outputs=[connection_status],
+        concurrency_limit=1,
+        concurrency_id="robot",
     )
 
     disconnect_btn.click(
         fn=handle_disconnect,
-        outputs=[connection_status, live_feed_toggle]
+        outputs=[connection_status, live_feed_toggle],
+        concurrency_limit=1,
+        concurrency_id="robot",
     )
 
     refresh_btn.click(
         fn=handle_get_observation,
-        outputs=[camera_display, observation_status, feedback_display]
+        outputs=[camera_display, observation_status, feedback_display],
+        concurrency_limit=1,
+        concurrency_id="robot",
     )
 
     stop_btn.click(
         fn=handle_stop,
-        outputs=[action_status, feedback_display]
-    )
-
-    # Quick control button events
-    forward_btn.click(
-        fn=handle_forward,
-        outputs=[action_status, feedback_display]
+        outputs=[action_status, feedback_display],
+        concurrency_limit=1,
+        concurrency_id="robot",
     )
 
-    backward_btn.click(
-        fn=handle_backward,
-        outputs=[action_status, feedback_display]
-    )
-
-    left_btn.click(
-        fn=handle_turn_left,
-        outputs=[action_status, feedback_display]
-    )
-
-    right_btn.click(
-        fn=handle_turn_right,
-        outputs=[action_status, feedback_display]
-    )
+    # Quick control button events. Each button feeds its fixed (left, right)
+    # pair into the shared batched handler.
+    quick_moves = [
+        (forward_btn, 0.15, 0.15),
+        (backward_btn, -0.15, -0.15),
+        (left_btn, -0.15, 0.15),
+        (right_btn, 0.15, -0.15),
+    ]
+    for button, left_value, right_value in quick_moves:
+        button.click(
+            fn=handle_move,
+            inputs=[gr.State(left_value), gr.State(right_value)],
+            outputs=[action_status, feedback_display],
+            batch=True,
+            max_batch_size=8,
+            concurrency_limit=1,
+            concurrency_id="robot",
+        )
 
-    # Auto-refresh: Use a timer to periodically update when enabled
-    live_feed_toggle.change(
+    # Auto-refresh: the toggle handler validates the connection and sets
+    # live_feed_active; the streaming generator is chained after it with
+    # .then() (below) so it never observes the flag before it is set
+    live_feed_event = live_feed_toggle.change(
         fn=handle_live_feed_toggle,
         inputs=[live_feed_toggle],
         outputs=[live_feed_toggle, observation_status]
     )
 
-    # Create a timer that fires frequently; we throttle updates manually
-    timer = gr.Timer(value=0.25)
-    timer.tick(
-        fn=auto_refresh_feed,
+    save_frames_btn.click(
+        fn=save_frame_history,
+        outputs=[observation_status]
+    )
+
+    # Frame streaming: chained after the toggle handler rather than bound
+    # to the toggle directly — independent listeners have no ordering
+    # guarantee, and the generator reaching its loop before the handler
+    # set live_feed_active would exit silently. Reads only the local
+    # latest-frame slot, so it deliberately stays off the single-lane
+    # "robot" queue.
+    live_feed_event.then(
+        fn=stream_frames,
         inputs=[live_feed_toggle, refresh_interval_slider],
-        outputs=[camera_display, observation_status, feedback_display]
+        outputs=[camera_display, observation_status, feedback_display],
     )
 
 
@@ -417,6 +681,9 @@ if __name__ == "__main__":
     print("Note: For remote control, ensure the Jetbot server is running on the target device.")
 
     try:
+        # Queueing is required for batched events. Bound concurrency so
+        # multiple tabs don't stampede the single robot connection.
+        demo.queue(default_concurrency_limit=4, max_size=32)
         demo.launch(
             server_name="0.0.0.0",
             server_port=7860,
@@ -48,6 +48,12 @@ def main():
         default="0.0.0.0",
         help="Host address to bind to (default: 0.0.0.0)"
     )
+    parser.add_argument(
+        "--mjpeg-port",
+        type=int,
+        default=None,
+        help="If set, also serve the camera as an MJPEG HTTP stream on this port"
+    )
     args = parser.parse_args()
 
     print("\n" + "=" * 60)
@@ -71,6 +77,7 @@ def main():
         host=args.host,
         camera_width=args.camera_width,
         camera_height=args.camera_height,
+        mjpeg_port=args.mjpeg_port,
     )
 
 
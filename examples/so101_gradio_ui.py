@@ -11,20 +11,67 @@ Make sure the SO-101 server is running before connecting.
 """
 
 import gradio as gr
+import logging
 import numpy as np
+import os
 import time
-import threading
+from operator import itemgetter
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from remote_robot import SO101Remote
 from lerobot.robots.so101_follower import SO101FollowerConfig
 
 
+# Set SO101_DEBUG=1 to re-read motor positions after every action (one
+# extra observation round-trip per slider press, camera payload included).
+DEBUG_ACTIONS = os.environ.get("SO101_DEBUG") == "1"
+
+logger = logging.getLogger(__name__)
+if DEBUG_ACTIONS:
+    logging.basicConfig(level=logging.DEBUG)
+
+
+# Fixed SO-101 schema. Prebuilt key tuples let the UI filter observations
+# with direct lookups instead of scanning every key with startswith() on
+# each polling tick.
+MOTOR_KEYS = (
+    "shoulder_pan.pos",
+    "shoulder_lift.pos",
+    "elbow_flex.pos",
+    "wrist_flex.pos",
+    "wrist_roll.pos",
+    "gripper.pos",
+)
+CAM_KEYS = ("observation.images.wrist", "main")
+
+# C-level extraction of the six slider positions in fixed motor order;
+# one itemgetter call replaces six chained dict.get invocations
+_MOTOR_GETTER = itemgetter(*MOTOR_KEYS)
+_MOTOR_DEFAULTS = {key: 0.0 for key in MOTOR_KEYS}
+
+
+def _positions_list(feedback: Dict[str, float]) -> list:
+    """Six slider positions in motor order, defaulting absent motors to 0."""
+    return list(_MOTOR_GETTER({**_MOTOR_DEFAULTS, **feedback}))
+
+
+# Wall clock sampled once; per-call timestamps are derived from the much
+# cheaper monotonic perf_counter instead of a datetime.now() syscall each
+# time a status line is built
+_WALL_START = datetime.now()
+_PERF_START = time.perf_counter()
+
+
+def _timestamp() -> str:
+    """Wall-clock HH:MM:SS.mmm for user-visible status lines."""
+    now = _WALL_START + timedelta(seconds=time.perf_counter() - _PERF_START)
+    return now.strftime("%H:%M:%S.%f")[:-3]
+
+
 # Global state
 robot: Optional[SO101Remote] = None
 live_feed_active = False
-live_feed_thread: Optional[threading.Thread] = None
 
 
 def connect_robot(host: str, port: int) -> tuple[str, str]:
@@ -68,8 +115,6 @@ def disconnect_robot() -> tuple[str, str]:
 
         # Stop live feed if active
         live_feed_active = False
-        if live_feed_thread is not None:
-            live_feed_thread.join(timeout=2.0)
 
         robot.disconnect()
         robot = None
@@ -81,27 +126,26 @@ def disconnect_robot() -> tuple[str, str]:
 
 def get_observation_once() -> tuple[Optional[np.ndarray], str, Dict[str, Any]]:
     """Get a single observation from the robot."""
-    global robot
-
-    if robot is None or not robot.is_connected:
+    # Snapshot the global and check connectivity once: is_connected can
+    # cost a remote attribute fetch, and the local alias also protects
+    # against a concurrent disconnect swapping the global mid-call
+    bot = robot
+    if bot is None or not bot.is_connected:
         return None, "Not connected to robot", {}
 
     try:
-        obs = robot.get_observation()
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        obs = bot.get_observation()
+        timestamp = _timestamp()
 
         # Extract camera image if available
         camera_image = None
-        if "observation.images.wrist" in obs:
-            camera_image = obs["observation.images.wrist"]
-        elif "main" in obs:
-            camera_image = obs["main"]
+        for key in CAM_KEYS:
+            if key in obs:
+                camera_image = obs[key]
+                break
 
         # Extract motor positions
-        motor_feedback = {
-            key: float(value) for key, value in obs.items()
-            if not key.startswith("observation.images") and key != "main"
-        }
+        motor_feedback = {key: float(obs[key]) for key in MOTOR_KEYS if key in obs}
 
         status = f"Observation received at {timestamp}"
         return camera_image, status, motor_feedback
@@ -111,11 +155,11 @@ def get_observation_once() -> tuple[Optional[np.ndarray], str, Dict[str, Any]]:
 
 
 def send_action(shoulder_pan: float, shoulder_lift: float, elbow_flex: float,
-                wrist_flex: float, wrist_roll: float, gripper: float) -> tuple[str, Dict[str, Any]]:
+                wrist_flex: float, wrist_roll: float, gripper: float,
+                settle_time: float = 0.0) -> tuple[str, Dict[str, Any]]:
     """Send motor commands to the robot and return updated motor feedback."""
-    global robot
-
-    if robot is None or not robot.is_connected:
+    bot = robot
+    if bot is None or not bot.is_connected:
         return "Not connected to robot", {}
 
     try:
@@ -129,75 +173,75 @@ def send_action(shoulder_pan: float, shoulder_lift: float, elbow_flex: float,
         }
 
         # Send action
-        result = robot.send_action(action)
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-
-        # Get updated observation after action
-        time.sleep(0.1)  # Small delay for motors to start moving
-        obs = robot.get_observation()
-
-        # Extract motor positions
-        motor_feedback = {
-            key: float(value) for key, value in obs.items()
-            if not key.startswith("observation.images") and key != "main"
-        }
+        result = bot.send_action(action)
+        timestamp = _timestamp()
+
+        if DEBUG_ACTIONS or settle_time > 0:
+            # Poll the server's motion flag instead of sleeping the full
+            # settle time; an already-stopped arm returns immediately
+            if settle_time > 0:
+                bot.wait_until_settled(timeout=settle_time)
+            # 24-byte packed read instead of a pickled dict; the reply is
+            # already keyed by MOTOR_KEYS with plain floats, so alias it
+            # directly instead of re-filtering and re-casting
+            motor_feedback = bot.get_positions()
+        else:
+            # The action echoed back after safety clipping is the feedback;
+            # no second round-trip, no hardcoded 100 ms stall
+            motor_feedback = {key: float(result[key]) for key in MOTOR_KEYS if key in result}
 
         # Show the values being sent
         values_str = ", ".join([f"{k.split('.')[0]}: {v:.2f}" for k, v in action.items()])
         status = f"Action sent at {timestamp}\nValues: {values_str}"
 
+        # Lazy %-style args: no formatting work unless DEBUG is enabled
+        logger.debug("Action %s -> feedback %s", action, motor_feedback)
+
         return status, motor_feedback
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("send_action failed")
         return f"Error: {str(e)}", {}
 
 
-def live_feed_worker(interval: float):
-    """Background worker for live camera feed."""
-    global live_feed_active
-
-    while live_feed_active:
-        time.sleep(interval)
-
-
 def toggle_live_feed(active: bool, interval: float) -> str:
     """Start or stop the live camera feed."""
-    global live_feed_active, live_feed_thread
+    global live_feed_active
 
     if active:
         if robot is None or not robot.is_connected:
             return "Cannot start live feed: Not connected"
 
+        # Have the server capture continuously into its latest-frame slot;
+        # update_live_feed gates on the flag, no client thread is needed
+        robot.start_observation_stream(rate_hz=max(1.0 / interval, 1.0))
+
         live_feed_active = True
-        live_feed_thread = threading.Thread(
-            target=live_feed_worker,
-            args=(interval,),
-            daemon=True
-        )
-        live_feed_thread.start()
         return "Live feed started"
     else:
         live_feed_active = False
-        if live_feed_thread is not None:
-            live_feed_thread.join(timeout=2.0)
+        if robot is not None:
+            robot.stop_observation_stream()
         return "Live feed stopped"
 
 
 def update_live_feed():
     """Update function for live feed (called by Gradio)."""
-    if not live_feed_active or robot is None or not robot.is_connected:
+    bot = robot
+    if not live_feed_active or bot is None or not bot.is_connected:
         return None
 
     try:
-        obs = robot.get_observation()
+        # Non-blocking: returns the server's buffered latest frame rather
+        # than waiting out camera exposure plus a fresh hardware read
+        obs = bot.get_latest_observation()
+        if obs is None:
+            return None
 
         # Extract camera image
-        if "observation.images.wrist" in obs:
-            return obs["observation.images.wrist"]
-        elif "main" in obs:
-            return obs["main"]
+        for key in CAM_KEYS:
+            if key in obs:
+                return obs[key]
         return None
 
     except Exception:
@@ -273,6 +317,10 @@ with gr.Blocks(title="SO-101 Remote Control") as demo:
             with gr.Group():
                 gr.Markdown("### Motor Controls")
 
+                # Plain Number inputs, deliberately without paired sliders:
+                # two-way slider<->number bindings would register a dozen
+                # .change callbacks that each round-trip over the websocket
+                # per drag. Values are only read when Send Action fires.
                 motor_controls = []
                 motor_names = [
                     ("shoulder_pan", "Shoulder Pan (deg)", 0.0),
@@ -291,6 +339,14 @@ with gr.Blocks(title="SO-101 Remote Control") as demo:
                     )
                     motor_controls.append(number)
 
+                settle_time_slider = gr.Slider(
+                    label="Settle Time (s)",
+                    minimum=0.0,
+                    maximum=0.5,
+                    value=0.0,
+                    step=0.05
+                )
+
                 send_action_btn = gr.Button("Send Action", variant="primary")
                 action_status = gr.Textbox(
                     label="Action Status",
@@ -318,29 +374,20 @@ with gr.Blocks(title="SO-101 Remote Control") as demo:
     def handle_get_observation():
         image, status, feedback = get_observation_once()
         # Extract motor positions for sliders
-        positions = [
-            feedback.get("shoulder_pan.pos", 0.0),
-            feedback.get("shoulder_lift.pos", 0.0),
-            feedback.get("elbow_flex.pos", 0.0),
-            feedback.get("wrist_flex.pos", 0.0),
-            feedback.get("wrist_roll.pos", 0.0),
-            feedback.get("gripper.pos", 0.0),
-        ]
-        return [image, status, feedback] + positions
-
-    def handle_send_action(*motor_values):
-        # motor_values already contains the 6 slider values
-        status, feedback = send_action(*motor_values)
-        # Extract motor positions for sliders
-        positions = [
-            feedback.get("shoulder_pan.pos", 0.0),
-            feedback.get("shoulder_lift.pos", 0.0),
-            feedback.get("elbow_flex.pos", 0.0),
-            feedback.get("wrist_flex.pos", 0.0),
-            feedback.get("wrist_roll.pos", 0.0),
-            feedback.get("gripper.pos", 0.0),
+        return [image, status, feedback] + _positions_list(feedback)
+
+    def handle_send_action(*inputs):
+        # inputs contains the 6 motor values plus the settle-time slider
+        status, feedback = send_action(*inputs)
+        # Only push back positions that actually differ from what the user
+        # commanded; gr.update() no-ops keep unchanged controls out of the
+        # websocket payload (1 status string instead of 7 values, usually)
+        positions = _positions_list(feedback)
+        commanded = inputs[:6]
+        return [status] + [
+            gr.update() if abs(pos - cmd) < 1e-3 else pos
+            for pos, cmd in zip(positions, commanded)
         ]
-        return [status] + positions
 
     def handle_live_feed_toggle(active, interval):
         status = toggle_live_feed(active, interval)
@@ -365,7 +412,7 @@ with gr.Blocks(title="SO-101 Remote Control") as demo:
 
     send_action_btn.click(
         fn=handle_send_action,
-        inputs=motor_controls,
+        inputs=motor_controls + [settle_time_slider],
         outputs=[action_status] + motor_controls
     )
 
@@ -5,9 +5,29 @@ Provides remote and local control for Jetbot and SO-101 robots with full
 LeRobot API compatibility.
 """
 
-from remote_robot.robots.jetbot_config import JetbotConfig
-from remote_robot.robots.jetbot_remote import JetbotRemote
-from remote_robot.robots.so101_remote import SO101Remote
+import importlib
 
 __version__ = "0.1.0"
+
+# PEP 562 lazy exports (see remote_robot.robots.__init__): cold-start
+# import of the package no longer drags in lerobot and numpy for tools
+# that only touch one robot class
+_LAZY = {
+    "JetbotConfig": ("remote_robot.robots.jetbot_config", "JetbotConfig"),
+    "JetbotRemote": ("remote_robot.robots.jetbot_remote", "JetbotRemote"),
+    "SO101Remote": ("remote_robot.robots.so101_remote", "SO101Remote"),
+}
+
 __all__ = ["JetbotRemote", "JetbotConfig", "SO101Remote"]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,7 +1,26 @@
 """Robot implementations compatible with LeRobot API."""
 
-from remote_robot.robots.jetbot_config import JetbotConfig
-from remote_robot.robots.jetbot_remote import JetbotRemote
-from remote_robot.robots.so101_remote import SO101Remote
+import importlib
+
+# PEP 562 lazy exports: importing the package stays cheap, and clients
+# that only need one robot class never pay for the other's dependency
+# chain (numpy, lerobot, camera utilities)
+_LAZY = {
+    "JetbotConfig": ("remote_robot.robots.jetbot_config", "JetbotConfig"),
+    "JetbotRemote": ("remote_robot.robots.jetbot_remote", "JetbotRemote"),
+    "SO101Remote": ("remote_robot.robots.so101_remote", "SO101Remote"),
+}
 
 __all__ = ["JetbotRemote", "JetbotConfig", "SO101Remote"]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -5,9 +5,13 @@ Provides LeRobot-compatible interface for remotely controlling Jetbot robots.
 """
 
 import logging
+from collections import deque
 from functools import cached_property
 from typing import Any, Optional
 
+import numpy as np
+import rpyc
+
 from lerobot.robots.robot import Robot
 from remote_robot.utils import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from remote_robot.robots.jetbot_config import JetbotConfig
@@ -52,6 +56,8 @@ class JetbotRemote(Robot):
         config: JetbotConfig,
         remote_host: str,
         remote_port: int = DEFAULT_JETBOT_PORT,
+        async_actions: bool = False,
+        frame_size: "tuple[int, int] | None" = None,
     ):
         """
         Initialize Jetbot remote robot.
@@ -60,6 +66,14 @@ class JetbotRemote(Robot):
             config: JetbotConfig instance
             remote_host: Remote host IP/hostname where jetbot_server.py is running
             remote_port: Port for remote connection (default: 18861)
+            async_actions: Fire actions without waiting for the reply.
+                send_action then echoes the commanded action and keeps at
+                most two requests in flight; call wait_action() when the
+                true clipped action is needed.
+            frame_size: Optional (width, height) to request from the
+                server. Policies that downsample anyway should set this so
+                the server downscales before JPEG encode, shrinking both
+                encode time and payload by the area ratio.
         """
         super().__init__(config)
         self.config = config
@@ -68,6 +82,18 @@ class JetbotRemote(Robot):
 
         # RPyC connection
         self._conn = None
+        # Cached connectivity flag: is_connected is polled by send_action
+        # and get_observation on every call, and asking the server each
+        # time would cost a full network round-trip per check
+        self._connected = False
+
+        # Fire-and-forget action pipeline (see async_actions)
+        self._async_actions = async_actions
+        self._async_send = None
+        self._inflight: deque = deque()
+
+        # Delivered frame size negotiated at connect (see frame_size)
+        self._frame_size = frame_size
 
         logger.info(f"Jetbot configured for remote operation at {remote_host}:{remote_port}")
 
@@ -76,16 +102,13 @@ class JetbotRemote(Robot):
         """
         Observation features from Jetbot.
 
+        Pre-connect default only; connect() overwrites the cache with the
+        server's schema (a transient fetch failure must raise there, not
+        silently poison the cache for the process lifetime).
+
         Returns:
             Dictionary with motor values and camera features
         """
-        if self._conn is not None:
-            try:
-                return self._conn.root.exposed_get_observation_features()
-            except:
-                pass
-
-        # Default Jetbot features
         return {
             "left_motor.value": float,
             "right_motor.value": float,
@@ -96,16 +119,12 @@ class JetbotRemote(Robot):
         """
         Action features for Jetbot.
 
+        Pre-connect default only; connect() overwrites the cache with the
+        server's schema (see observation_features).
+
         Returns:
             Dictionary with motor control features
         """
-        if self._conn is not None:
-            try:
-                return self._conn.root.exposed_get_action_features()
-            except:
-                pass
-
-        # Default Jetbot features
         return {
             "left_motor.value": float,
             "right_motor.value": float,
@@ -113,13 +132,8 @@ class JetbotRemote(Robot):
 
     @property
     def is_connected(self) -> bool:
-        """Check if robot is connected."""
-        if self._conn is None:
-            return False
-        try:
-            return self._conn.root.exposed_is_connected()
-        except:
-            return False
+        """Check if robot is connected (cached, no network traffic)."""
+        return self._conn is not None and self._connected
 
     @property
     def is_calibrated(self) -> bool:
@@ -149,10 +163,34 @@ class JetbotRemote(Robot):
 
             # Call remote connect
             self._conn.root.exposed_connect(calibrate=False)
+
+            # Fetch the schemas once, materialized into local dicts, and
+            # store straight into the cached_property slots: later accesses
+            # are plain local lookups with no RPyC traffic
+            self.__dict__["observation_features"] = dict(
+                self._conn.root.exposed_get_observation_features()
+            )
+            self.__dict__["action_features"] = dict(
+                self._conn.root.exposed_get_action_features()
+            )
+
+            # Negotiate the delivered frame size once; older servers
+            # without the RPC fall back to native frames
+            if self._frame_size is not None:
+                try:
+                    self._conn.root.exposed_set_frame_size(*self._frame_size)
+                except AttributeError:
+                    logger.info("Server does not support frame size negotiation")
+
+            if self._async_actions:
+                self._async_send = rpyc.async_(self._conn.root.exposed_send_action)
+
+            self._connected = True
             logger.info("Remote Jetbot connected successfully")
 
         except Exception as e:
             self._conn = None
+            self._connected = False
             raise RemoteConnectionError(f"Failed to connect to remote Jetbot: {e}")
 
     def disconnect(self) -> None:
@@ -164,10 +202,18 @@ class JetbotRemote(Robot):
 
         try:
             logger.info("Disconnecting from remote Jetbot")
+            # Drain any in-flight async actions before tearing down
+            while self._inflight:
+                try:
+                    self._inflight.popleft().wait()
+                except Exception:
+                    pass
+            self._async_send = None
             if self._conn is not None:
                 self._conn.root.exposed_disconnect()
                 self._conn.close()
                 self._conn = None
+            self._connected = False
             logger.info("Remote Jetbot disconnected")
         except Exception as e:
             logger.error(f"Error disconnecting from remote Jetbot: {e}")
@@ -200,6 +246,14 @@ class JetbotRemote(Robot):
             # Encode action for network transfer
             encoded_action = encode_action(action)
 
+            if self._async_send is not None:
+                # Fire-and-forget with a bounded in-flight window for
+                # back-pressure; the ack is available via wait_action()
+                while len(self._inflight) >= 2:
+                    self._inflight.popleft().wait()
+                self._inflight.append(self._async_send(encoded_action))
+                return action
+
             # Send to remote server
             result = self._conn.root.exposed_send_action(encoded_action)
 
@@ -210,6 +264,120 @@ class JetbotRemote(Robot):
             logger.error(f"Error sending action to remote Jetbot: {e}")
             raise
 
+    def send_action_noreply(self, action: dict[str, Any]) -> None:
+        """
+        Queue an action on the server without waiting for any reply.
+
+        The server drops the command into a one-slot queue and applies the
+        newest one from a worker thread, so a teleop loop can stream
+        commands at full rate with no per-action round trip. Use
+        send_action() when the clipped ack matters.
+
+        Args:
+            action: Dictionary with "left_motor.value" and "right_motor.value"
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"Jetbot is not connected. Try running `robot.connect()` first."
+            )
+
+        try:
+            # Pass the two speeds by value: a dict argument crosses as a
+            # netref, and the server resolving it would block on a
+            # callback this fire-and-forget path never serves
+            rpyc.async_(self._conn.root.exposed_send_action_noreply)(
+                float(action.get("left_motor.value", 0.0)),
+                float(action.get("right_motor.value", 0.0)),
+            )
+        except AttributeError:
+            # Older server: fall back to the acked endpoint
+            self.send_action(action)
+
+    def wait_action(self) -> Optional[dict[str, Any]]:
+        """
+        Wait for the oldest in-flight async action and return its result.
+
+        Returns:
+            The motor values the server acked, or None if nothing is
+            pending (including when async_actions is disabled)
+        """
+        if not self._inflight:
+            return None
+        future = self._inflight.popleft()
+        future.wait()
+        return dict(future.value) if future.value else None
+
+    def step(self, action: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Send an action and get the following observation in one round trip.
+
+        Uses the server's combined step RPC where available (one RTT, and
+        the camera arrives as raw JPEG bytes); falls back to pipelined
+        async calls against older servers.
+
+        Args:
+            action: Dictionary with "left_motor.value" and "right_motor.value"
+
+        Returns:
+            Tuple of (action actually sent, following observation)
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"Jetbot is not connected. Try running `robot.connect()` first."
+            )
+
+        try:
+            result, obs = self._conn.root.exposed_step(encode_action(action))
+        except AttributeError:
+            # Older server without the combined endpoint
+            return self.send_action_and_observe(action)
+
+        obs = dict(obs)
+        camera = obs.get("camera")
+        if camera is not None:
+            # Force a local copy so pixels aren't fetched via netref round-trips
+            obs["camera"] = bytes(camera)
+        return dict(result), obs
+
+    def send_action_and_observe(
+        self, action: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Send an action and fetch the next observation in one round-trip.
+
+        Issues both requests back-to-back on the connection as RPyC async
+        futures, so the pair overlaps on the wire and costs roughly one
+        network RTT instead of two sequential ones.
+
+        Args:
+            action: Dictionary with "left_motor.value" and "right_motor.value"
+
+        Returns:
+            Tuple of (action actually sent, following observation)
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"Jetbot is not connected. Try running `robot.connect()` first."
+            )
+
+        try:
+            async_send = rpyc.async_(self._conn.root.exposed_send_action)
+            async_obs = rpyc.async_(self._conn.root.exposed_get_observation)
+
+            send_future = async_send(encode_action(action))
+            obs_future = async_obs()
+
+            send_future.wait()
+            sent = send_future.value
+            return (
+                decode_observation(sent) if sent else action,
+                decode_observation(obs_future.value),
+            )
+
+        except Exception as e:
+            logger.error(f"Error sending pipelined action to remote Jetbot: {e}")
+            raise
+
     def get_observation(self) -> dict[str, Any]:
         """
         Get observation from the remote Jetbot.
@@ -230,6 +398,64 @@ class JetbotRemote(Robot):
             logger.error(f"Error getting observation from remote Jetbot: {e}")
             raise
 
+    def get_motor_state(self) -> dict[str, float]:
+        """
+        Get current motor values without camera data.
+
+        The server packs the pair as 8 bytes of float32 rather than a
+        pickled dict, so this stays cheap enough for tight feedback loops.
+
+        Returns:
+            Dictionary with "left_motor.value" and "right_motor.value"
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"Jetbot is not connected. Try running `robot.connect()` first."
+            )
+
+        try:
+            packed = bytes(self._conn.root.exposed_get_motor_state())
+            state = np.frombuffer(packed, dtype=np.float32)
+            return {
+                "left_motor.value": float(state[0]),
+                "right_motor.value": float(state[1]),
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting motor state from remote Jetbot: {e}")
+            raise
+
+    def get_observation_jpeg(self, quality: int = 80) -> dict[str, Any]:
+        """
+        Get observation with the camera frame as raw JPEG bytes.
+
+        Unlike get_observation(), the "camera" entry is left as compressed
+        JPEG bytes (no base64 round-trip, no decode); callers decode with
+        cv2.imdecode when they actually need pixels.
+
+        Args:
+            quality: JPEG quality (0-100)
+
+        Returns:
+            Dictionary with motor values and "camera" as JPEG bytes (if available)
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"Jetbot is not connected. Try running `robot.connect()` first."
+            )
+
+        try:
+            obs = dict(self._conn.root.exposed_get_observation_jpeg(quality))
+            camera = obs.get("camera")
+            if camera is not None:
+                # Force a local copy so pixels aren't fetched via netref round-trips
+                obs["camera"] = bytes(camera)
+            return obs
+
+        except Exception as e:
+            logger.error(f"Error getting observation from remote Jetbot: {e}")
+            raise
+
     def __del__(self):
         """Cleanup on deletion."""
         try:
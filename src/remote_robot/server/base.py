@@ -4,19 +4,54 @@ Base RPyC service for robot servers.
 Provides common lifecycle management and safety features.
 """
 
+import gc
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Optional
 
+import numpy as np
 import rpyc
 from rpyc.core.protocol import Connection
 
 from remote_robot.utils.serialization import encode_observation, decode_action
+from remote_robot.utils.udp_frames import UdpFrameSender
+from remote_robot.utils.wire import pack, unpack, pack_features
 
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _no_gc():
+    """
+    Suspend garbage collection for a short encode/decode burst.
+
+    Packing an observation allocates a flurry of tuples and dicts that
+    can trigger generational scans mid-RPC; bracketing the burst skips
+    them. Only re-enables collection if it was on when we started, so
+    nesting and user-level gc.disable() are respected.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _needs_encoding(obs: dict) -> bool:
+    """Whether an observation contains arrays that require encoding."""
+    for value in obs.values():
+        if isinstance(value, np.ndarray):
+            return True
+    return False
+
+
 class BaseRobotServer(rpyc.Service, ABC):
     """
     Base RPyC service for robot servers.
@@ -28,10 +63,47 @@ class BaseRobotServer(rpyc.Service, ABC):
     - Automatic cleanup on client disconnect
     """
 
-    def __init__(self):
+    def __init__(self, debug_actions: bool = False):
         super().__init__()
         self._robot = None
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Opt-in per-action logging; the hot path stays silent by default
+        self._debug_actions = debug_actions
+        # Fixed motor-key order for vectorized debug deltas, cached on
+        # first use
+        self._motor_keys: Optional[list[str]] = None
+        # Scalar observation keys, discovered once: the key set is fixed
+        # per robot, so per-call isinstance scans are wasted work
+        self._scalar_keys: Optional[tuple] = None
+        # Feature schemas copied once per session; on some robots the
+        # underlying properties query hardware on every access. The
+        # packed blobs are cached alongside so the schema RPCs reply
+        # without re-serializing.
+        self._obs_features_cache: Optional[dict] = None
+        self._act_features_cache: Optional[dict] = None
+        self._obs_features_blob: Optional[bytes] = None
+        self._act_features_blob: Optional[bytes] = None
+
+        # Shared-memory region attached on demand for co-located clients
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+        # Single-slot latest-observation buffer fed by an optional capture
+        # thread (drop-oldest semantics: only the newest frame is kept)
+        self._latest_obs: Optional[dict] = None
+        self._latest_obs_lock = threading.Lock()
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_running = False
+
+        # UDP frame push stream (images off the TCP control path)
+        self._frame_sender: Optional[UdpFrameSender] = None
+        self._frame_thread: Optional[threading.Thread] = None
+        self._frame_streaming = False
+
+        # Live-connection count: clients open extra pooled connections to
+        # the same service, and hardware must only be neutralized when
+        # the LAST one goes away, not when a spare is closed mid-session
+        self._live_conns = 0
+        self._live_conns_lock = threading.Lock()
 
     @abstractmethod
     def _initialize_robot(self):
@@ -55,15 +127,55 @@ class BaseRobotServer(rpyc.Service, ABC):
 
     def on_connect(self, conn: Connection):
         """Called when client connects."""
-        self.logger.info(f"Client connected from {conn}")
+        with self._live_conns_lock:
+            self._live_conns += 1
+        self.logger.info("Client connected from %s", conn)
 
     def on_disconnect(self, conn: Connection):
-        """Called when client disconnects - ensures safe cleanup."""
-        self.logger.info(f"Client disconnected from {conn}")
+        """Called when a client disconnects.
+
+        Puts the hardware in a safe state only when the LAST connection
+        closes: clients may hold several pooled connections to this
+        service, and dropping a spare must not disable the robot under
+        the session still running on the others.
+        """
+        with self._live_conns_lock:
+            self._live_conns = max(0, self._live_conns - 1)
+            remaining = self._live_conns
+        self.logger.info(
+            "Client disconnected from %s (%d connection(s) remaining)",
+            conn, remaining,
+        )
+        if remaining > 0:
+            return
         try:
-            self._cleanup_robot()
+            self._capture_running = False
+            self._frame_streaming = False
+            if self._shm is not None:
+                self._shm.close()
+                self._shm = None
+            self._safe_state()
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
+
+    def _safe_state(self):
+        """
+        Put the hardware in a safe state while keeping the handle alive.
+
+        Called on client disconnect so a reconnect after a network blip
+        skips the seconds-long hardware handshake. Subclasses that can
+        cheaply neutralize the robot (zero torque, stop motors) should
+        override this; the default falls back to a full teardown.
+        """
+        self._cleanup_robot()
+
+    def _resume_robot(self):
+        """
+        Re-arm a robot kept alive by _safe_state on fast reconnect.
+
+        Subclasses that override _safe_state should undo it here (e.g.
+        re-enable torque). Default is a no-op.
+        """
 
     # ===== LeRobot Robot API Methods =====
     # These are exposed to RPyC clients
@@ -79,13 +191,20 @@ class BaseRobotServer(rpyc.Service, ABC):
             if self._robot is None:
                 self.logger.info("Initializing robot")
                 self._initialize_robot()
-
-            self.logger.info(f"Connecting robot (calibrate={calibrate})")
+            elif getattr(self._robot, "is_connected", False):
+                # Hardware kept alive across the last disconnect (see
+                # _safe_state): skip the handshake and just re-arm
+                self.logger.info("Robot already connected; resuming")
+                self._resume_robot()
+                return
+
+            self.logger.info("Connecting robot (calibrate=%s)", calibrate)
             self._robot.connect(calibrate=calibrate)
+            self._prime_feature_caches()
             self.logger.info("Robot connected successfully")
 
         except Exception as e:
-            self.logger.error(f"Failed to connect robot: {e}")
+            self.logger.error("Failed to connect robot: %s", e)
             raise
 
     def exposed_disconnect(self) -> None:
@@ -96,7 +215,7 @@ class BaseRobotServer(rpyc.Service, ABC):
                 self._robot.disconnect()
                 self.logger.info("Robot disconnected")
         except Exception as e:
-            self.logger.error(f"Failed to disconnect robot: {e}")
+            self.logger.error("Failed to disconnect robot: %s", e)
             raise
 
     def exposed_calibrate(self) -> None:
@@ -108,7 +227,7 @@ class BaseRobotServer(rpyc.Service, ABC):
             self._robot.calibrate()
             self.logger.info("Calibration complete")
         except Exception as e:
-            self.logger.error(f"Calibration failed: {e}")
+            self.logger.error("Calibration failed: %s", e)
             raise
 
     def exposed_configure(self) -> None:
@@ -118,7 +237,7 @@ class BaseRobotServer(rpyc.Service, ABC):
                 raise RuntimeError("Robot not initialized")
             self._robot.configure()
         except Exception as e:
-            self.logger.error(f"Configuration failed: {e}")
+            self.logger.error("Configuration failed: %s", e)
             raise
 
     def exposed_get_observation(self) -> dict[str, Any]:
@@ -126,7 +245,9 @@ class BaseRobotServer(rpyc.Service, ABC):
         Get current robot observation.
 
         Returns:
-            Encoded observation dictionary (with images as base64 strings)
+            Encoded observation dictionary (images as raw JPEG bytes;
+            decode_observation handles both this and the legacy base64
+            form)
         """
         try:
             if self._robot is None:
@@ -135,13 +256,330 @@ class BaseRobotServer(rpyc.Service, ABC):
             # Get observation from robot
             obs = self._robot.get_observation()
 
+            # Scalar-only observations (no cameras configured) marshal
+            # fine as-is; skip the full-dict encode pass
+            if not _needs_encoding(obs):
+                return obs
+
             # Encode for network transfer
-            encoded_obs = encode_observation(obs)
+            with _no_gc():
+                encoded_obs = encode_observation(obs)
 
             return encoded_obs
 
         except Exception as e:
-            self.logger.error(f"Failed to get observation: {e}")
+            self.logger.error("Failed to get observation: %s", e)
+            raise
+
+    def exposed_get_observation_compressed(self) -> dict[str, Any]:
+        """
+        Get current robot observation with images as raw JPEG bytes.
+
+        Same encoding as exposed_get_observation but without the base64
+        wrapper around compressed frames: ~25% fewer bytes on the wire and
+        no base64 encode/decode on either end.
+
+        Returns:
+            Encoded observation dictionary (images as JPEG bytes)
+        """
+        try:
+            if self._robot is None:
+                raise RuntimeError("Robot not initialized")
+
+            obs = self._robot.get_observation()
+            return encode_observation(obs, binary_images=True)
+
+        except Exception as e:
+            self.logger.error("Failed to get observation: %s", e)
+            raise
+
+    def exposed_get_observation_packed(self) -> bytes:
+        """
+        Get current robot observation as a single packed bytes blob.
+
+        The observation is encoded with binary images and then serialized
+        into one blob, so RPyC ships a single bytestring instead of a
+        dict that clients walk through per-key netref traffic.
+
+        Returns:
+            Packed observation (decode with remote_robot.utils.wire.unpack)
+        """
+        try:
+            if self._robot is None:
+                raise RuntimeError("Robot not initialized")
+
+            obs = self._robot.get_observation()
+            return pack(encode_observation(obs, binary_images=True))
+
+        except Exception as e:
+            self.logger.error("Failed to get observation: %s", e)
+            raise
+
+    def exposed_send_action_packed(self, packed_action: bytes) -> bytes:
+        """
+        Send a packed action and return the packed result.
+
+        Args:
+            packed_action: Action dictionary serialized with wire.pack
+
+        Returns:
+            Packed dictionary of the action actually sent after clipping
+        """
+        try:
+            if self._robot is None:
+                raise RuntimeError("Robot not initialized")
+
+            with _no_gc():
+                decoded_action = decode_action(unpack(packed_action))
+            result = self._robot.send_action(decoded_action)
+            with _no_gc():
+                return pack(
+                    {key: float(value) for key, value in result.items()}
+                )
+
+        except Exception as e:
+            self.logger.error("Failed to send action: %s", e)
+            raise
+
+    def exposed_get_observation_shm(self, name: str) -> int:
+        """
+        Write the packed observation into a client-owned shared memory block.
+
+        Fast path for clients on the same host: the image-bearing payload
+        is written once into the named SharedMemory region and only its
+        length crosses the RPyC socket, skipping the kernel socket buffer
+        copy per frame.
+
+        Args:
+            name: Name of a SharedMemory block created by the client
+
+        Returns:
+            Number of payload bytes written at offset 0
+
+        Raises:
+            ValueError: If the payload does not fit the region
+        """
+        try:
+            if self._robot is None:
+                raise RuntimeError("Robot not initialized")
+
+            obs = self._robot.get_observation()
+            with _no_gc():
+                payload = pack(encode_observation(obs, binary_images=True))
+
+            if self._shm is None or self._shm.name != name:
+                if self._shm is not None:
+                    self._shm.close()
+                self._shm = shared_memory.SharedMemory(name=name)
+
+            if len(payload) > self._shm.size:
+                raise ValueError(
+                    f"Observation ({len(payload)} bytes) exceeds shared "
+                    f"memory region ({self._shm.size} bytes)"
+                )
+
+            self._shm.buf[:len(payload)] = payload
+            return len(payload)
+
+        except Exception as e:
+            self.logger.error("Failed to get observation via shm: %s", e)
+            raise
+
+    def exposed_step(self, action) -> tuple[bytes, bytes]:
+        """
+        Send an action and return the following observation in one RPC.
+
+        Collapses the send_action + get_observation pair into a single
+        round trip, halving per-cycle network latency for control loops.
+
+        Args:
+            action: Action dictionary serialized with wire.pack, or a
+                plain dict for clients that do not use the wire format
+
+        Returns:
+            Tuple of (packed clipped action, packed observation)
+        """
+        try:
+            if self._robot is None:
+                raise RuntimeError("Robot not initialized")
+
+            with _no_gc():
+                if isinstance(action, (bytes, bytearray)):
+                    action = unpack(action)
+                else:
+                    action = dict(action)
+                decoded_action = decode_action(action)
+            result = self._robot.send_action(decoded_action)
+            obs = self._robot.get_observation()
+            with _no_gc():
+                return (
+                    pack({key: float(value) for key, value in result.items()}),
+                    pack(encode_observation(obs, binary_images=True)),
+                )
+
+        except Exception as e:
+            self.logger.error("Failed to step: %s", e)
+            raise
+
+    def exposed_start_observation_stream(self, rate_hz: float = 15.0) -> None:
+        """
+        Start a server-side capture loop feeding the latest-observation slot.
+
+        The loop continuously reads the robot and overwrites a single
+        buffered observation (drop-oldest), so exposed_get_latest_observation
+        can answer immediately instead of blocking on camera exposure plus
+        a fresh hardware read.
+
+        Args:
+            rate_hz: Target capture rate in Hz
+        """
+        if self._robot is None:
+            raise RuntimeError("Robot not initialized")
+        if self._capture_running:
+            return
+
+        self._capture_running = True
+        period = 1.0 / float(rate_hz)
+
+        def _capture_loop():
+            while self._capture_running:
+                start = time.monotonic()
+                try:
+                    obs = self._robot.get_observation()
+                    encoded = encode_observation(obs, binary_images=True)
+                    with self._latest_obs_lock:
+                        self._latest_obs = encoded
+                except Exception as e:
+                    self.logger.error("Observation capture failed: %s", e)
+                elapsed = time.monotonic() - start
+                if elapsed < period:
+                    time.sleep(period - elapsed)
+
+        self._capture_thread = threading.Thread(target=_capture_loop, daemon=True)
+        self._capture_thread.start()
+        self.logger.info("Observation stream started at %s Hz", rate_hz)
+
+    def exposed_stop_observation_stream(self) -> None:
+        """Stop the server-side capture loop."""
+        self._capture_running = False
+        self.logger.info("Observation stream stopped")
+
+    def exposed_get_latest_observation(self) -> Optional[dict]:
+        """
+        Get the newest buffered observation without waiting for a capture.
+
+        Returns:
+            Encoded observation dictionary, or None if the stream has not
+            produced a frame yet (start with exposed_start_observation_stream)
+        """
+        with self._latest_obs_lock:
+            return self._latest_obs
+
+    def exposed_start_frame_stream(
+        self, host: str, port: int, rate_hz: float = 15.0
+    ) -> None:
+        """
+        Push camera frames to a client UDP receiver, off the TCP path.
+
+        Keeping images on the RPyC socket lets one large frame stall the
+        small action RPCs queued behind it. This loop encodes each
+        capture's image entries and sends them as sequenced UDP datagrams
+        to the given address instead; a lost datagram costs a frame, not
+        a control message.
+
+        Args:
+            host: Client address to send to
+            port: Client UDP port (see utils.udp_frames.UdpFrameReceiver)
+            rate_hz: Target capture rate in Hz
+        """
+        if self._robot is None:
+            raise RuntimeError("Robot not initialized")
+        if self._frame_streaming:
+            return
+        # Make sure a previous loop has fully exited before starting a
+        # new one: a lingering loop would otherwise wake up, see the
+        # flag set again and double-send alongside the new thread
+        self._join_frame_thread()
+
+        # The loop owns its sender as a local: reading self._frame_sender
+        # would race a stop/start cycle reassigning it, and closing the
+        # attribute on exit could close the NEW stream's socket
+        sender = UdpFrameSender(host, port)
+        self._frame_sender = sender
+        self._frame_streaming = True
+        period = 1.0 / float(rate_hz)
+
+        def _frame_loop():
+            image_keys = None
+            while self._frame_streaming:
+                start = time.monotonic()
+                try:
+                    obs = self._robot.get_observation()
+                    if image_keys is None:
+                        # Key set is fixed per robot; scan types once
+                        image_keys = tuple(
+                            key
+                            for key, value in obs.items()
+                            if isinstance(value, np.ndarray) and value.ndim == 3
+                        )
+                    images = {key: obs[key] for key in image_keys}
+                    if images:
+                        with _no_gc():
+                            payload = pack(
+                                encode_observation(images, binary_images=True)
+                            )
+                        sender.send(payload)
+                except Exception as e:
+                    self.logger.error("Frame stream failed: %s", e)
+                elapsed = time.monotonic() - start
+                if elapsed < period:
+                    time.sleep(period - elapsed)
+            sender.close()
+
+        self._frame_thread = threading.Thread(target=_frame_loop, daemon=True)
+        self._frame_thread.start()
+        self.logger.info("UDP frame stream started to %s:%s", host, port)
+
+    def _join_frame_thread(self) -> None:
+        """Wait for a stopped frame loop to finish and close its sender."""
+        thread = self._frame_thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=5.0)
+        self._frame_thread = None
+        self._frame_sender = None
+
+    def exposed_stop_frame_stream(self) -> None:
+        """Stop the UDP frame push loop and wait for it to exit."""
+        self._frame_streaming = False
+        self._join_frame_thread()
+        self.logger.info("UDP frame stream stopped")
+
+    def exposed_get_motor_state(self) -> dict[str, float]:
+        """
+        Get the scalar (motor) part of the observation only.
+
+        Camera frames are filtered out server-side, so the reply is a few
+        dozen bytes instead of an encoded image — suitable for action
+        feedback paths that only need positions.
+
+        Returns:
+            Dictionary of scalar observation entries
+        """
+        try:
+            if self._robot is None:
+                raise RuntimeError("Robot not initialized")
+
+            obs = self._robot.get_observation()
+            if self._scalar_keys is None:
+                self._scalar_keys = tuple(
+                    key
+                    for key, value in obs.items()
+                    if isinstance(value, (int, float))
+                )
+            return {key: float(obs[key]) for key in self._scalar_keys}
+
+        except Exception as e:
+            self.logger.error("Failed to get motor state: %s", e)
             raise
 
     def exposed_send_action(self, action: dict[str, Any]) -> dict[str, Any]:
@@ -164,10 +602,34 @@ class BaseRobotServer(rpyc.Service, ABC):
             # Send to robot
             result = self._robot.send_action(decoded_action)
 
+            if self._debug_actions and self.logger.isEnabledFor(logging.DEBUG):
+                if self._motor_keys is None:
+                    self._motor_keys = sorted(
+                        key for key in result if key.endswith(".pos")
+                    )
+                keys = self._motor_keys
+                # SoA arrays + one vectorized subtract instead of per-key
+                # dict comprehensions
+                commanded = np.fromiter(
+                    (float(decoded_action.get(key, 0.0)) for key in keys),
+                    dtype=np.float32,
+                    count=len(keys),
+                )
+                clipped = np.fromiter(
+                    (float(result.get(key, 0.0)) for key in keys),
+                    dtype=np.float32,
+                    count=len(keys),
+                )
+                self.logger.debug(
+                    "motors=%s delta=%s",
+                    keys,
+                    np.array2string(clipped - commanded, precision=3),
+                )
+
             return result
 
         except Exception as e:
-            self.logger.error(f"Failed to send action: {e}")
+            self.logger.error("Failed to send action: %s", e)
             raise
 
     def exposed_is_connected(self) -> bool:
@@ -177,7 +639,7 @@ class BaseRobotServer(rpyc.Service, ABC):
                 return False
             return self._robot.is_connected
         except Exception as e:
-            self.logger.error(f"Failed to check connection status: {e}")
+            self.logger.error("Failed to check connection status: %s", e)
             return False
 
     def exposed_is_calibrated(self) -> bool:
@@ -187,17 +649,76 @@ class BaseRobotServer(rpyc.Service, ABC):
                 return False
             return self._robot.is_calibrated
         except Exception as e:
-            self.logger.error(f"Failed to check calibration status: {e}")
+            self.logger.error("Failed to check calibration status: %s", e)
             return False
 
+    def _prime_feature_caches(self) -> None:
+        """
+        Snapshot both feature schemas and their packed blobs.
+
+        Run once right after the robot connects, so every schema RPC
+        for the rest of the session answers from memory: no hardware
+        property access, no dict copy, no re-serialization.
+        """
+        self._obs_features_cache = dict(self._robot.observation_features)
+        self._act_features_cache = dict(self._robot.action_features)
+        self._obs_features_blob = pack_features(self._obs_features_cache)
+        self._act_features_blob = pack_features(self._act_features_cache)
+
     def exposed_get_observation_features(self) -> dict[str, type | tuple]:
         """Get observation feature definitions."""
         try:
             if self._robot is None:
                 raise RuntimeError("Robot not initialized")
-            return dict(self._robot.observation_features)
+            if self._obs_features_cache is None:
+                self._obs_features_cache = dict(self._robot.observation_features)
+            return self._obs_features_cache
+        except Exception as e:
+            self.logger.error("Failed to get observation features: %s", e)
+            raise
+
+    def exposed_get_observation_features_packed(self) -> bytes:
+        """
+        Get observation feature definitions as one packed blob.
+
+        A plain dict return crosses the wire as a netref that clients
+        walk with one round trip per key; the packed form is a single
+        RPC with types encoded by name.
+
+        Returns:
+            Blob for remote_robot.utils.wire.unpack_features
+        """
+        try:
+            if self._robot is None:
+                raise RuntimeError("Robot not initialized")
+            if self._obs_features_blob is None:
+                if self._obs_features_cache is None:
+                    self._obs_features_cache = dict(
+                        self._robot.observation_features
+                    )
+                self._obs_features_blob = pack_features(self._obs_features_cache)
+            return self._obs_features_blob
+        except Exception as e:
+            self.logger.error("Failed to get observation features: %s", e)
+            raise
+
+    def exposed_get_action_features_packed(self) -> bytes:
+        """
+        Get action feature definitions as one packed blob.
+
+        Returns:
+            Blob for remote_robot.utils.wire.unpack_features
+        """
+        try:
+            if self._robot is None:
+                raise RuntimeError("Robot not initialized")
+            if self._act_features_blob is None:
+                if self._act_features_cache is None:
+                    self._act_features_cache = dict(self._robot.action_features)
+                self._act_features_blob = pack_features(self._act_features_cache)
+            return self._act_features_blob
         except Exception as e:
-            self.logger.error(f"Failed to get observation features: {e}")
+            self.logger.error("Failed to get action features: %s", e)
             raise
 
     def exposed_get_action_features(self) -> dict[str, type]:
@@ -205,7 +726,9 @@ class BaseRobotServer(rpyc.Service, ABC):
         try:
             if self._robot is None:
                 raise RuntimeError("Robot not initialized")
-            return dict(self._robot.action_features)
+            if self._act_features_cache is None:
+                self._act_features_cache = dict(self._robot.action_features)
+            return self._act_features_cache
         except Exception as e:
-            self.logger.error(f"Failed to get action features: {e}")
+            self.logger.error("Failed to get action features: %s", e)
             raise
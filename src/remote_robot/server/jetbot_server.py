@@ -4,24 +4,133 @@ RPyC server for Jetbot robot - Python 3.5+ compatible version.
 This server has minimal dependencies and does NOT require LeRobot.
 Only requires: rpyc, jetbot, opencv-python, numpy
 
-Run this script on Jetbot hardware to enable remote control.
+This is the single source for the Jetbot service; run it on Jetbot
+hardware to enable remote control.
 
 Usage:
-    python jetbot_server_py35.py
+    python -m remote_robot.server.jetbot_server
 """
 
-import base64
 import logging
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
 
 import cv2
 import numpy as np
 import rpyc
-from rpyc.utils.server import ThreadedServer
+from rpyc.utils.server import ThreadPoolServer
 
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_JETBOT_PORT = 18861
+DEFAULT_MJPEG_PORT = 8090
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# The Nano's hardware JPEG engine, reached through nvJPEG (pynvjpeg
+# bindings). Software encoding of 224x224 @ 30 FPS costs a sizable slice
+# of one A57 core; the hardware block does it off-CPU, leaving the cores
+# to RPyC. A single persistent encoder instance amortizes device setup.
+try:
+    from nvjpeg import NvJpeg
+    _nvjpeg = NvJpeg()
+except Exception:
+    _nvjpeg = None
+
+# libjpeg-turbo uses NEON SIMD DCT/Huffman kernels on the Jetson's ARM
+# cores, which the stock OpenCV JPEG codec does not; optional, with
+# cv2.imencode as the fallback
+try:
+    from turbojpeg import TurboJPEG
+    _turbo = TurboJPEG()
+except Exception:
+    _turbo = None
+
+# Default JPEG quality: 75 costs a fraction of the encode time of
+# OpenCV's default 95 on the Nano and ships ~30% fewer bytes
+JPEG_QUALITY = 75
+
+# Per-quality cv2 parameter lists, built once: the encode loop runs at
+# camera rate and only ever sees a couple of distinct qualities
+_JPEG_QUALITY_FLAG = int(cv2.IMWRITE_JPEG_QUALITY)
+_JPEG_PARAMS = {}
+
+
+def _encode_jpeg(frame, quality=JPEG_QUALITY):
+    """Encode a BGR frame to JPEG bytes with the fastest available codec.
+
+    Codec ladder: nvJPEG hardware engine, then libjpeg-turbo (NEON),
+    then OpenCV software encode.
+
+    Note on buffers: OpenCV's Python imencode cannot write into a
+    caller-owned dst, so the cv2 fallback unavoidably allocates its
+    output array per frame; the TurboJPEG path manages its own reusable
+    compression buffer internally, which is another reason to prefer it.
+    """
+    if _nvjpeg is not None:
+        return _nvjpeg.encode(frame, quality)
+    if _turbo is not None:
+        return _turbo.encode(frame, quality=quality)
+    params = _JPEG_PARAMS.get(quality)
+    if params is None:
+        params = [_JPEG_QUALITY_FLAG, int(quality)]
+        _JPEG_PARAMS[quality] = params
+    ok, buffer = cv2.imencode('.jpg', frame, params)
+    if not ok:
+        raise ValueError("JPEG encoding failed")
+    return buffer.tobytes()
+
+
+def _pin_cpus(cpus, label):
+    """Pin the calling thread to a CPU set, if the platform allows it.
+
+    On the Nano's four A57 cores the JPEG encode loop can land on the
+    same core as the RPyC dispatcher and cause tail-latency spikes;
+    keeping them on disjoint cores avoids that. Best-effort: skipped on
+    platforms without sched_setaffinity or with fewer cores than asked
+    for.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpus = {c for c in cpus if c < (os.cpu_count() or 1)}
+    if not cpus:
+        return
+    try:
+        os.sched_setaffinity(0, cpus)
+        logger.info("Pinned %s thread to CPUs %s", label, sorted(cpus))
+    except OSError as e:
+        logger.debug("Could not pin %s thread: %s", label, e)
+
+
+def _clip11(x):
+    """Clamp a scalar to [-1.0, 1.0]."""
+    return -1.0 if x < -1.0 else (1.0 if x > 1.0 else x)
+
+
+def _clip_pair(values):
+    """Clamp a length-2 float32 array to [-1.0, 1.0] into a new array."""
+    out = np.empty(2, np.float32)
+    out[0] = -1.0 if values[0] < -1.0 else (1.0 if values[0] > 1.0 else values[0])
+    out[1] = -1.0 if values[1] < -1.0 else (1.0 if values[1] > 1.0 else values[1])
+    return out
+
+
+if njit is not None:
+    # Compile and warm the kernels once at import, so a 50-200 Hz teleop
+    # loop pays native compare cost per action rather than interpreter
+    # overhead (numba stays optional; the plain functions are the fallback)
+    _clip11 = njit(cache=True)(_clip11)
+    _clip11(0.0)
+    _clip_pair = njit(cache=True, fastmath=True)(_clip_pair)
+    _clip_pair(np.zeros(2, np.float32))
 
 
 class JetbotService(rpyc.Service):
@@ -33,47 +142,84 @@ class JetbotService(rpyc.Service):
     direct RPyC clients.
     """
 
-    def __init__(self, camera_width=224, camera_height=224):
+    def __init__(self, camera_width=224, camera_height=224,
+                 target_width=None, target_height=None):
         """
         Initialize Jetbot service.
 
         Args:
             camera_width: Camera frame width
             camera_height: Camera frame height
+            target_width: If set (with target_height), downscale frames
+                to this width before JPEG encode
+            target_height: Delivered frame height (see target_width)
         """
         super(JetbotService, self).__init__()
         self.robot = None
         self.camera = None
         self.camera_width = camera_width
         self.camera_height = camera_height
+        self._frame_buf = None
+
+        # Delivered frame size, (width, height) or None for native.
+        # Policies consuming 84x84 or 112x112 inputs shouldn't pay to
+        # encode and ship the full capture; downscaling server-side
+        # (cv2.resize uses NEON on the Nano) shrinks encode time and
+        # payload by the area ratio. Single tuple so readers see a
+        # consistent size without locking.
+        if target_width and target_height:
+            self._target_size = (int(target_width), int(target_height))
+        else:
+            self._target_size = None
+
+        # Latest-JPEG slot fed by a dedicated capture thread: RPCs return
+        # the slot instead of blocking on CSI capture + encode, so encode
+        # cost is bounded by camera FPS rather than request rate
+        self._latest_jpeg = None
+        self._jpeg_lock = threading.Lock()
+        self._capture_thread = None
+        self._capture_running = False
+
+        # Drop-oldest slot for no-reply actions plus the worker applying
+        # them: the RPC returns as soon as the command is queued and only
+        # the newest command ever reaches the motors
+        self._pending_action = deque(maxlen=1)
+        self._action_event = threading.Event()
+        self._action_thread = None
+        self._action_running = False
 
         # Current motor values (for observation)
         self._left_value = 0.0
         self._right_value = 0.0
 
-        logger.info("JetbotService initialized (camera: {}x{})".format(
-            camera_width, camera_height))
+        logger.info("JetbotService initialized (camera: %sx%s)",
+            camera_width, camera_height)
 
     def on_connect(self, conn):
         """Called when client connects."""
-        logger.info("Client connected from {}".format(conn))
+        logger.info("Client connected from %s", conn)
 
     def on_disconnect(self, conn):
         """Called when client disconnects - ensures safe cleanup."""
-        logger.info("Client disconnected from {}".format(conn))
+        logger.info("Client disconnected from %s", conn)
         try:
             # Stop camera
             if self.camera is not None:
+                self._capture_running = False
                 self.camera.stop()
                 self.camera = None
+                self._frame_buf = None
+                self._latest_jpeg = None
                 logger.info("Camera stopped")
 
             # Stop motors
+            self._action_running = False
+            self._action_event.set()
             if self.robot is not None:
                 self.robot.stop()
                 logger.info("Motors stopped")
         except Exception as e:
-            logger.error("Error during cleanup: {}".format(e))
+            logger.error("Error during cleanup: %s", e)
 
     # ===== Simple Motor Control API =====
 
@@ -89,61 +235,202 @@ class JetbotService(rpyc.Service):
             True on success
         """
         try:
-            logger.debug("set_motors: left={}, right={}".format(left_speed, right_speed))
-
-            # Lazy initialization
-            if self.robot is None:
-                from jetbot import Robot
-                logger.debug("Initializing robot")
-                self.robot = Robot()
-
-            # Set motor values
-            self.robot.left_motor.value = float(left_speed)
-            self.robot.right_motor.value = float(right_speed)
+            logger.debug("set_motors: left=%s, right=%s", left_speed, right_speed)
 
-            # Store for observation
-            self._left_value = float(left_speed)
-            self._right_value = float(right_speed)
+            # Clamp with the scalar kernel (same as exposed_send_action):
+            # no np.clip ufunc dispatch, plain Python floats throughout
+            self._apply_motors(_clip11(float(left_speed)),
+                               _clip11(float(right_speed)))
 
             logger.debug("Motors set successfully")
             return True
 
         except Exception as e:
-            logger.error("Error setting motors: {}".format(e))
+            logger.error("Error setting motors: %s", e)
             raise
 
+    def _apply_motors(self, left, right):
+        """Write already-clipped float speeds to the motors.
+
+        Internal sink for every action path; callers convert and clamp
+        exactly once at their boundary so values aren't re-cast on the
+        way through (this runs per command at teleop rate).
+        """
+        # Lazy initialization
+        if self.robot is None:
+            from jetbot import Robot
+            logger.debug("Initializing robot")
+            self.robot = Robot()
+
+        # Set motor values
+        self.robot.left_motor.value = left
+        self.robot.right_motor.value = right
+
+        # Store for observation
+        self._left_value = left
+        self._right_value = right
+
+    def _ensure_camera(self):
+        """Lazily initialize the camera and its staging buffer on first use."""
+        if self.camera is None:
+            from jetbot import Camera
+            logger.info("Initializing camera (%sx%s)",
+                self.camera_width, self.camera_height)
+            self.camera = Camera.instance(
+                width=self.camera_width,
+                height=self.camera_height
+            )
+            # Persistent staging buffer reused for every frame; allocating
+            # a fresh HxWx3 array per capture would churn megabytes/s of
+            # garbage at streaming rates
+            self._frame_buf = np.empty(
+                (self.camera_height, self.camera_width, 3), dtype=np.uint8
+            )
+            self._start_capture_thread()
+
+    def _maybe_resize(self, frame):
+        """Downscale a frame to the negotiated delivered size, if any.
+
+        INTER_AREA is the right filter for shrinking (it averages source
+        pixels instead of aliasing) and OpenCV's ARM build runs it on
+        NEON.
+        """
+        target = self._target_size
+        if target is None or (frame.shape[1], frame.shape[0]) == target:
+            return frame
+        return cv2.resize(frame, target, interpolation=cv2.INTER_AREA)
+
+    def exposed_set_frame_size(self, width, height):
+        """
+        Negotiate the delivered frame size (camera capture is unchanged).
+
+        Clients that downsample anyway call this once at connect so the
+        downscale happens before JPEG encode, cutting encode time and
+        payload by the area ratio.
+
+        Args:
+            width: Delivered frame width, or None/0 to restore native size
+            height: Delivered frame height, or None/0 to restore native size
+        """
+        if width and height:
+            self._target_size = (int(width), int(height))
+        else:
+            self._target_size = None
+        logger.info("Delivered frame size set to %s", self._target_size)
+        return True
+
+    def _start_capture_thread(self):
+        """Start the background frame capture/encode loop (idempotent)."""
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+
+        self._capture_running = True
+
+        def _capture_loop():
+            # Keep the encode loop off the cores serving RPyC requests
+            _pin_cpus({3}, "capture")
+            try:
+                # Favour the capture thread so a busy dispatcher cannot
+                # starve frame delivery (needs CAP_SYS_NICE; best-effort)
+                os.nice(-5)
+            except (OSError, AttributeError):
+                pass
+            while self._capture_running and self.camera is not None:
+                try:
+                    np.copyto(self._frame_buf, self.camera.value)
+                    jpeg = _encode_jpeg(self._maybe_resize(self._frame_buf))
+                    with self._jpeg_lock:
+                        self._latest_jpeg = jpeg
+                except Exception as e:
+                    logger.warning("Capture loop error: %s", e)
+                    time.sleep(0.25)
+                    continue
+                # Pace roughly at camera rate; encoding any faster only
+                # re-compresses the same frame
+                time.sleep(1.0 / 30.0)
+
+        self._capture_thread = threading.Thread(target=_capture_loop, daemon=True)
+        self._capture_thread.start()
+
     def exposed_get_camera_frame(self):
         """
-        Get camera frame as base64-encoded JPEG.
+        Get camera frame as raw JPEG bytes.
+
+        Skips the old base64 wrapper: the compressed buffer ships as-is,
+        a third smaller on the wire with no encode/decode pass on either
+        end (clients feed it straight to cv2.imdecode).
 
         Returns:
-            Base64-encoded JPEG string, or None on error
+            JPEG bytes, or None on error
         """
         try:
-            # Lazy initialization
-            if self.camera is None:
-                from jetbot import Camera
-                logger.info("Initializing camera ({}x{})".format(
-                    self.camera_width, self.camera_height))
-                self.camera = Camera.instance(
-                    width=self.camera_width,
-                    height=self.camera_height
-                )
+            self._ensure_camera()
+
+            # Serve the capture thread's newest frame; RPC rate no longer
+            # dictates encode rate
+            with self._jpeg_lock:
+                jpeg = self._latest_jpeg
+            if jpeg is not None:
+                return jpeg
+
+            # Capture thread hasn't produced a frame yet: encode one
+            # synchronously from the staging buffer
+            np.copyto(self._frame_buf, self.camera.value)
+            return _encode_jpeg(self._maybe_resize(self._frame_buf))
+
+        except Exception as e:
+            logger.error("Error getting camera frame: %s", e)
+            return None
+
+    def exposed_get_observation_jpeg(self, quality=80):
+        """
+        Get observation with the camera frame as raw JPEG bytes.
 
-            # Get frame from camera
-            frame = self.camera.value
+        Skips the base64 step of exposed_get_observation: the compressed
+        JPEG buffer is shipped as plain bytes, which RPyC transfers by
+        value in a single message. Clients decode with cv2.imdecode.
 
-            # Encode as JPEG for efficient transfer
-            _, buffer = cv2.imencode('.jpg', frame)
+        Args:
+            quality: JPEG quality (0-100)
 
-            # Convert to base64 string
-            jpg_as_text = base64.b64encode(buffer).decode('utf-8')
+        Returns:
+            Dictionary with motor values and "camera" as JPEG bytes
+        """
+        try:
+            obs = {
+                "__type__": "observation",
+                "left_motor.value": self._left_value,
+                "right_motor.value": self._right_value,
+            }
 
-            return jpg_as_text
+            try:
+                # Same latest-frame slot as exposed_get_camera_frame; the
+                # quality argument only matters for the cold-start encode
+                frame = self.exposed_get_camera_frame()
+                if frame is not None:
+                    obs["camera"] = frame
+            except Exception as e:
+                logger.warning("Failed to get camera frame: %s", e)
+                # Continue without camera data
 
+            return obs
         except Exception as e:
-            logger.error("Error getting camera frame: {}".format(e))
-            return None
+            logger.error("Failed to get observation: %s", e)
+            raise
+
+    def exposed_get_motor_state(self):
+        """
+        Get current motor values as a packed float32 pair.
+
+        Ships 8 bytes ([left, right] as float32) instead of a pickled dict,
+        which keeps motor-only feedback polls nearly free on the wire.
+
+        Returns:
+            bytes of a float32 array [left_value, right_value]
+        """
+        return np.array(
+            [self._left_value, self._right_value], dtype=np.float32
+        ).tobytes()
 
     # ===== LeRobot-Compatible API =====
     # These methods allow the server to work with remote_robot.Jetbot client
@@ -157,7 +444,7 @@ class JetbotService(rpyc.Service):
                 self.robot = Robot()
             logger.info("Jetbot connected")
         except Exception as e:
-            logger.error("Failed to connect: {}".format(e))
+            logger.error("Failed to connect: %s", e)
             raise
 
     def exposed_disconnect(self):
@@ -168,7 +455,7 @@ class JetbotService(rpyc.Service):
                 self.robot.stop()
             logger.info("Jetbot disconnected")
         except Exception as e:
-            logger.error("Failed to disconnect: {}".format(e))
+            logger.error("Failed to disconnect: %s", e)
             raise
 
     def exposed_send_action(self, action):
@@ -182,31 +469,113 @@ class JetbotService(rpyc.Service):
             Actual action sent
         """
         try:
+            if not hasattr(action, "get"):
+                # Batched/array form: a [left, right] pair, clamped by the
+                # compiled kernel in one call instead of two scalar trips
+                pair = _clip_pair(np.asarray(action, dtype=np.float32))
+                self._apply_motors(float(pair[0]), float(pair[1]))
+                return {
+                    "left_motor.value": float(self.robot.left_motor.value),
+                    "right_motor.value": float(self.robot.right_motor.value),
+                }
+
             left = action.get("left_motor.value", 0.0)
             right = action.get("right_motor.value", 0.0)
 
-            # Clip to valid range
-            left = np.clip(left, -1.0, 1.0)
-            right = np.clip(right, -1.0, 1.0)
+            # Clip to valid range. Scalar compares skip np.clip's per-call
+            # ufunc dispatch (~microseconds for a 0-d array) and keep the
+            # values plain Python floats instead of np.float64; when numba
+            # is installed the kernel runs as native code.
+            left = _clip11(float(left))
+            right = _clip11(float(right))
 
-            self.exposed_set_motors(left, right)
+            self._apply_motors(left, right)
 
+            # Ack with the post-write state read back from the motor driver;
+            # clients can trust this immediately instead of sleeping and
+            # re-polling to see whether the command landed.
             return {
-                "left_motor.value": left,
-                "right_motor.value": right,
+                "left_motor.value": float(self.robot.left_motor.value),
+                "right_motor.value": float(self.robot.right_motor.value),
             }
         except Exception as e:
-            logger.error("Failed to send action: {}".format(e))
+            logger.error("Failed to send action: %s", e)
             raise
 
+    def exposed_step(self, action, quality=80):
+        """
+        Send an action and return the following observation in one RPC.
+
+        Halves per-cycle round trips for control loops that always read
+        after writing; the observation carries the camera frame as raw
+        JPEG bytes (see exposed_get_observation_jpeg).
+
+        Args:
+            action: Dictionary with "left_motor.value" and "right_motor.value"
+            quality: JPEG quality (0-100) for the observation frame
+
+        Returns:
+            Tuple of (actual action sent, observation dictionary)
+        """
+        result = self.exposed_send_action(action)
+        return result, self.exposed_get_observation_jpeg(quality)
+
+    def exposed_send_action_noreply(self, left_speed, right_speed):
+        """
+        Queue a motor command without marshalling a reply.
+
+        Returns immediately after dropping the command into a one-slot
+        queue; a worker thread applies the newest command to the motors.
+        Clients wrap this with rpyc.async_ to pipeline actions without
+        waiting out a round trip each. The speeds arrive by value: a
+        dict argument would be a netref, and reading it here would
+        block on a callback the fire-and-forget caller never serves.
+
+        Args:
+            left_speed: Left motor speed in range [-1.0, 1.0]
+            right_speed: Right motor speed in range [-1.0, 1.0]
+        """
+        left = _clip11(float(left_speed))
+        right = _clip11(float(right_speed))
+        self._start_action_thread()
+        self._pending_action.append((left, right))
+        self._action_event.set()
+
+    def _start_action_thread(self):
+        """Start the worker applying queued no-reply actions (idempotent)."""
+        if self._action_thread is not None and self._action_thread.is_alive():
+            return
+
+        self._action_running = True
+
+        def _apply_loop():
+            while self._action_running:
+                if not self._action_event.wait(timeout=0.5):
+                    continue
+                self._action_event.clear()
+                try:
+                    left, right = self._pending_action.pop()
+                except IndexError:
+                    continue
+                try:
+                    self._apply_motors(left, right)
+                except Exception as e:
+                    logger.error("Failed to apply queued action: %s", e)
+
+        self._action_thread = threading.Thread(target=_apply_loop, daemon=True)
+        self._action_thread.start()
+
     def exposed_get_observation(self):
         """
         Get observation from robot (LeRobot API compatibility).
 
         Returns:
-            Dictionary with motor values and camera frame (base64 encoded)
+            Dictionary with motor values and camera frame (raw JPEG bytes)
         """
         try:
+            # Fresh dicts per call: reply dicts cross to the client as
+            # netrefs and are read after this method returns, so a shared
+            # skeleton would let the next call tear a concurrent reader
             obs = {
                 "__type__": "observation",
                 "left_motor.value": self._left_value,
@@ -215,21 +584,26 @@ class JetbotService(rpyc.Service):
 
             # Initialize and get camera frame
             try:
-                frame_b64 = self.exposed_get_camera_frame()
-                if frame_b64:
+                frame = self.exposed_get_camera_frame()
+                if frame:
+                    if self._target_size is not None:
+                        shape = (self._target_size[1], self._target_size[0], 3)
+                    else:
+                        shape = (self.camera_height, self.camera_width, 3)
                     obs["camera"] = {
                         "__type__": "image",
-                        "data": frame_b64,
-                        "shape": (self.camera_height, self.camera_width, 3),
+                        "data": frame,
+                        "encoding": "jpeg",
+                        "shape": shape,
                         "dtype": "uint8",
                     }
             except Exception as e:
-                logger.warning("Failed to get camera frame: {}".format(e))
+                logger.warning("Failed to get camera frame: %s", e)
                 # Continue without camera data
 
             return obs
         except Exception as e:
-            logger.error("Failed to get observation: {}".format(e))
+            logger.error("Failed to get observation: %s", e)
             raise
 
     def exposed_is_connected(self):
@@ -266,11 +640,88 @@ class JetbotService(rpyc.Service):
         }
 
 
+# Static multipart preamble for the MJPEG stream; only the length varies
+_MJPEG_PART_HEADER = (
+    b"--frame\r\n"
+    b"Content-Type: image/jpeg\r\n"
+    b"Content-Length: %d\r\n\r\n"
+)
+
+
+def start_mjpeg_stream(service, port=DEFAULT_MJPEG_PORT, host="0.0.0.0",
+                       fps=15, quality=80):
+    """
+    Serve the Jetbot camera as a multipart MJPEG stream over HTTP.
+
+    This is a push transport for the live feed: the server sends frames as
+    they are captured and stale frames are never queued behind fresh ones,
+    unlike request/response polling over RPyC. Browsers (and the Gradio UI)
+    can render the stream directly via ``<img src="http://host:port/stream">``.
+    Motor control stays on RPyC.
+
+    Args:
+        service: JetbotService instance (camera is shared with RPyC clients)
+        port: HTTP port to serve the stream on (default: 8090)
+        host: Host address to bind to (default: 0.0.0.0)
+        fps: Target frames per second
+        quality: JPEG quality (0-100)
+
+    Returns:
+        The running HTTP server (daemon threads; stops with the process)
+    """
+    frame_period = 1.0 / float(fps)
+
+    class MJPEGHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path not in ("/", "/stream"):
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header(
+                "Content-Type", "multipart/x-mixed-replace; boundary=frame")
+            self.end_headers()
+
+            try:
+                while True:
+                    service._ensure_camera()
+                    frame = service.camera.value
+                    try:
+                        data = _encode_jpeg(frame, quality)
+                    except ValueError:
+                        data = None
+                    if data:
+                        # One formatted header alloc instead of rebuilding
+                        # the multipart preamble by concatenation per frame
+                        self.wfile.write(_MJPEG_PART_HEADER % len(data))
+                        self.wfile.write(data)
+                        self.wfile.write(b"\r\n")
+                    time.sleep(frame_period)
+            except (BrokenPipeError, ConnectionResetError):
+                logger.info("MJPEG client disconnected")
+            except Exception as e:
+                logger.error("MJPEG stream error: %s", e)
+
+        def log_message(self, format, *args):
+            logger.debug("MJPEG: %s", format % args)
+
+    class MJPEGServer(ThreadingMixIn, HTTPServer):
+        daemon_threads = True
+
+    server = MJPEGServer((host, port), MJPEGHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logger.info("MJPEG stream available at http://%s:%s/stream", host, port)
+    return server
+
+
 def start_jetbot_server(
     port=DEFAULT_JETBOT_PORT,
     host="0.0.0.0",
     camera_width=224,
     camera_height=224,
+    mjpeg_port=None,
 ):
     """
     Start Jetbot RPyC server.
@@ -280,6 +731,8 @@ def start_jetbot_server(
         host: Host address to bind to (default: 0.0.0.0 for all interfaces)
         camera_width: Camera frame width (default: 224)
         camera_height: Camera frame height (default: 224)
+        mjpeg_port: If set, also serve the camera as an MJPEG HTTP stream
+            on this port (see start_mjpeg_stream)
     """
     # Configure logging
     logging.basicConfig(
@@ -287,22 +740,39 @@ def start_jetbot_server(
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+    # Let a whole JPEG frame go out in one write() instead of being
+    # sliced into 64 KB chunks that each cost a syscall and a copy, and
+    # skip zlib: JPEG payloads are already entropy-coded, so compressing
+    # them burns CPU for ~0 size reduction
+    from rpyc.core import channel, stream
+    channel.Channel.COMPRESSION_LEVEL = 0
+    stream.SocketStream.MAX_IO_CHUNK = 1024 * 1024
+
     logger.info("=" * 60)
     logger.info("Starting Jetbot RPyC Server")
     logger.info("=" * 60)
-    logger.info("Host: {}".format(host))
-    logger.info("Port: {}".format(port))
-    logger.info("Camera: {}x{}".format(camera_width, camera_height))
+    logger.info("Host: %s", host)
+    logger.info("Port: %s", port)
+    logger.info("Camera: %sx%s", camera_width, camera_height)
     logger.info("=" * 60)
 
     # Create service
     service = JetbotService(camera_width=camera_width, camera_height=camera_height)
 
-    # Create RPyC server
-    server = ThreadedServer(
+    # Optional camera push stream (live feed without RPyC polling)
+    if mjpeg_port is not None:
+        start_mjpeg_stream(service, port=mjpeg_port, host=host)
+
+    # Create RPyC server. A robot serves one teleop client at a time, so
+    # a fixed two-thread pool (one active client, one slot for a
+    # reconnect racing the old connection's teardown) replaces the
+    # thread-per-client ThreadedServer; fewer runnable threads means
+    # less GIL ping-pong against the JPEG encode loop.
+    server = ThreadPoolServer(
         service,
         port=port,
         hostname=host,
+        nbThreads=2,
         protocol_config={
             'allow_all_attrs': True,
             'allow_pickle': True,
@@ -311,15 +781,19 @@ def start_jetbot_server(
         }
     )
 
+    # Leave CPU 3 to the capture/encode thread; the acceptor and the
+    # worker threads it spawns inherit this mask
+    _pin_cpus({0, 1, 2}, "server")
+
     try:
         logger.info("Server started successfully")
-        logger.info("Clients can connect to {}:{}".format(host, port))
+        logger.info("Clients can connect to %s:%s", host, port)
         logger.info("Press Ctrl+C to stop server")
         server.start()
     except KeyboardInterrupt:
         logger.info("\nServer interrupted by user")
     except Exception as e:
-        logger.error("Server error: {}".format(e))
+        logger.error("Server error: %s", e)
         raise
     finally:
         logger.info("Shutting down Jetbot server")
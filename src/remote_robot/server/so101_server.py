@@ -4,7 +4,12 @@ RPyC server for SO-101 robot arm.
 Run this script on the computer connected to SO-101 hardware to enable remote control.
 """
 
+import atexit
 import logging
+import signal
+import struct
+import sys
+import time
 
 from lerobot.robots.so101_follower import SO101Follower, SO101FollowerConfig
 from remote_robot.server.base import BaseRobotServer
@@ -14,6 +19,16 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_SO101_PORT = 18862
 
+# Fixed motor order shared with clients decoding the packed-positions RPC
+MOTOR_KEYS = (
+    "shoulder_pan.pos",
+    "shoulder_lift.pos",
+    "elbow_flex.pos",
+    "wrist_flex.pos",
+    "wrist_roll.pos",
+    "gripper.pos",
+)
+
 
 class SO101Server(BaseRobotServer):
     """
@@ -23,14 +38,15 @@ class SO101Server(BaseRobotServer):
     Uses LeRobot's SO101Follower with full API compatibility.
     """
 
-    def __init__(self, config: SO101FollowerConfig):
+    def __init__(self, config: SO101FollowerConfig, debug_actions: bool = False):
         """
         Initialize SO-101 server.
 
         Args:
             config: SO101FollowerConfig for robot configuration
+            debug_actions: Log each action and its result at DEBUG level
         """
-        super().__init__()
+        super().__init__(debug_actions=debug_actions)
         self.config = config
         self.logger.info(f"SO101Server initialized with config: {config}")
 
@@ -40,6 +56,121 @@ class SO101Server(BaseRobotServer):
         self._robot = SO101Follower(self.config)
         self.logger.info("SO-101 robot initialized")
 
+    def exposed_get_positions_packed(self) -> bytes:
+        """
+        Get the six joint positions as packed float32 bytes.
+
+        24 bytes on the wire in the fixed MOTOR_KEYS order, instead of a
+        pickled dict with per-key overhead — the cheapest state channel
+        for feedback loops that poll positions only.
+
+        Returns:
+            struct.pack("6f", ...) of the positions in MOTOR_KEYS order
+        """
+        if self._robot is None:
+            raise RuntimeError("Robot not initialized")
+
+        obs = self._robot.get_observation()
+        return struct.pack("6f", *(float(obs[key]) for key in MOTOR_KEYS))
+
+    def exposed_send_action_packed6(self, packed: bytes) -> bytes:
+        """
+        Apply six packed float32 joint targets and reply in kind.
+
+        The fixed MOTOR_KEYS field order stands in for key strings, so a
+        full action round trip is 24 bytes each way with no per-key
+        hashing or encoding.
+
+        Args:
+            packed: struct.pack("6f") targets in MOTOR_KEYS order
+
+        Returns:
+            struct.pack("6f") of the clipped action in the same order
+        """
+        if self._robot is None:
+            raise RuntimeError("Robot not initialized")
+
+        values = struct.unpack("6f", bytes(packed))
+        result = self._robot.send_action(dict(zip(MOTOR_KEYS, values)))
+        return struct.pack(
+            "6f", *(float(result.get(key, 0.0)) for key in MOTOR_KEYS)
+        )
+
+    def exposed_is_moving(self, threshold: float = 0.5) -> bool:
+        """
+        Check whether any joint is still in motion.
+
+        Reads the Feetech "Moving" status register when the bus exposes
+        it (a few bytes over serial), so clients can poll instead of
+        sleeping a fixed settle time after every action. Falls back to
+        comparing two quick position reads if the register is unavailable.
+
+        Args:
+            threshold: Position delta (in normalized units) treated as
+                motion in the fallback path
+
+        Returns:
+            True if any motor appears to be moving
+        """
+        if self._robot is None:
+            raise RuntimeError("Robot not initialized")
+
+        bus = getattr(self._robot, "bus", None)
+        if bus is not None:
+            try:
+                moving = bus.sync_read("Moving", normalize=False)
+                return any(bool(value) for value in moving.values())
+            except Exception:
+                pass
+
+        def _positions():
+            return {
+                key: float(value)
+                for key, value in self._robot.get_observation().items()
+                if isinstance(value, (int, float))
+            }
+
+        before = _positions()
+        time.sleep(0.02)
+        after = _positions()
+        return any(
+            abs(after[key] - before[key]) > threshold for key in before
+        )
+
+    def _safe_state(self):
+        """Zero torque on client disconnect but keep the hardware handle.
+
+        Re-running the USB/servo handshake costs seconds; after a
+        transient network blip the next exposed_connect resumes against
+        the live handle instead (see _resume_robot). Full teardown only
+        happens at process exit via _cleanup_robot.
+        """
+        if self._robot is None:
+            return
+        try:
+            bus = getattr(self._robot, "bus", None)
+            if bus is not None and self._robot.is_connected:
+                bus.disable_torque()
+                self.logger.info(
+                    "Torque disabled; hardware kept alive for fast reconnect"
+                )
+                return
+        except Exception as e:
+            self.logger.error(f"Error entering safe state: {e}")
+        # No bus to neutralize through: fall back to full teardown
+        self._cleanup_robot()
+
+    def _resume_robot(self):
+        """Re-enable torque on a handle kept alive by _safe_state."""
+        try:
+            bus = getattr(self._robot, "bus", None)
+            if bus is not None:
+                bus.enable_torque()
+                self.logger.info("Torque re-enabled on resume")
+        except Exception as e:
+            self.logger.error(f"Error resuming robot: {e}")
+            raise
+
     def _cleanup_robot(self):
         """Clean up SO-101 hardware - disable torque and disconnect."""
         if self._robot is not None:
@@ -68,7 +199,8 @@ def start_so101_server(
         host: Host address to bind to (default: 0.0.0.0 for all interfaces)
     """
     import rpyc
-    from rpyc.utils.server import ThreadedServer
+    from rpyc.core import channel, stream
+    from rpyc.utils.server import ThreadPoolServer
 
     # Configure logging
     logging.basicConfig(
@@ -76,14 +208,28 @@ def start_so101_server(
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+    # JPEG-bearing observations are already entropy-coded, so zlib only
+    # burns CPU; and a large IO chunk lets a whole frame leave in one
+    # write() instead of 64 KB slices
+    channel.Channel.COMPRESSION_LEVEL = 0
+    stream.SocketStream.MAX_IO_CHUNK = 4 * 1024 * 1024
+
     logger.info(f"Starting SO-101 RPyC server on {host}:{port}")
     logger.info(f"Config: {config}")
 
     # Create server
     service = SO101Server(config)
 
-    # RPyC server configuration
-    server = ThreadedServer(
+    # Disconnects only neutralize the robot (see _safe_state); the full
+    # hardware teardown is deferred to process exit. SIGTERM is mapped
+    # to SystemExit so systemd stops also unwind through atexit.
+    atexit.register(service._cleanup_robot)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    # RPyC server configuration. ThreadPoolServer reuses a fixed worker
+    # pool instead of spawning a thread per connection, which pairs with
+    # the client-side connection pool without unbounded thread growth.
+    server = ThreadPoolServer(
         service,
         port=port,
         hostname=host,
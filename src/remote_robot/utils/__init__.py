@@ -2,14 +2,19 @@
 
 from remote_robot.utils.serialization import (
     encode_image,
+    encode_image_bytes,
     decode_image,
     encode_observation,
     decode_observation,
     encode_action,
     decode_action,
 )
+from remote_robot.utils.wire import pack, unpack
 from remote_robot.utils.remote_client import (
     create_rpyc_connection,
+    get_or_create_rpyc_connection,
+    close_pooled_connections,
+    is_local_host,
     test_connection,
     RemoteConnectionError,
 )
@@ -28,12 +33,18 @@ class DeviceNotConnectedError(Exception):
 
 __all__ = [
     "encode_image",
+    "encode_image_bytes",
     "decode_image",
     "encode_observation",
     "decode_observation",
     "encode_action",
     "decode_action",
+    "pack",
+    "unpack",
     "create_rpyc_connection",
+    "get_or_create_rpyc_connection",
+    "close_pooled_connections",
+    "is_local_host",
     "test_connection",
     "RemoteConnectionError",
     "DeviceAlreadyConnectedError",
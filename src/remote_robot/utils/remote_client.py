@@ -3,6 +3,9 @@ Remote client utilities for establishing RPyC connections.
 """
 
 import logging
+import random
+import socket
+import threading
 import time
 from typing import Optional
 
@@ -58,16 +61,56 @@ def create_rpyc_connection(
         try:
             logger.info(f"Attempting to connect to {host}:{port} (attempt {attempt}/{retry_attempts})")
             conn = rpyc.connect(host, port, config=config)
+
+            # Disable Nagle's algorithm so small RPC messages (motor
+            # commands, acks) go out immediately instead of waiting to be
+            # coalesced; essential when pipelining requests. Keepalive
+            # catches half-open connections to robots on flaky Wi-Fi.
+            try:
+                sock = conn._channel.stream.sock
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                # Aggressive keepalive probing (idle 5s, probe every 1s)
+                # so a dead robot link is detected in seconds, not the
+                # kernel-default two hours; not all platforms expose
+                # these knobs, hence the hasattr guards
+                if hasattr(socket, "TCP_KEEPIDLE"):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 5)
+                if hasattr(socket, "TCP_KEEPINTVL"):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 1)
+                if hasattr(socket, "TCP_KEEPCNT"):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 5)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Socket options: TCP_NODELAY=%s SO_KEEPALIVE=%s",
+                        sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY),
+                        sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE),
+                    )
+            except (AttributeError, OSError) as e:
+                logger.debug(f"Could not set socket options: {e}")
+
             logger.info(f"Successfully connected to {host}:{port}")
             return conn
 
+        except PermissionError as e:
+            # Refused by policy (firewall, capabilities): retrying the
+            # same thing can never succeed, fail fast instead
+            last_error = e
+            logger.error(f"Connection not permitted: {e}")
+            break
+
         except (ConnectionRefusedError, TimeoutError, OSError) as e:
             last_error = e
             logger.warning(f"Connection attempt {attempt} failed: {e}")
 
             if attempt < retry_attempts:
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                # Exponential backoff (capped) with jitter so clients
+                # that lost the server together don't all reconnect on
+                # the same tick
+                delay = min(retry_delay * (2 ** (attempt - 1)), 30.0)
+                delay *= 0.5 + random.random() * 0.5
+                logger.info("Retrying in %.1f seconds...", delay)
+                time.sleep(delay)
             else:
                 logger.error(f"All {retry_attempts} connection attempts failed")
 
@@ -77,6 +120,100 @@ def create_rpyc_connection(
     )
 
 
+# Process-wide pool of live connections, one per (host, port). Robot
+# classes hold their own long-lived connection; this pool serves
+# shorter-lived callers (scripts, UIs) that would otherwise pay the TCP
+# setup plus RPyC handshake on every call.
+_pool: dict = {}
+_pool_lock = threading.Lock()
+
+
+def get_or_create_rpyc_connection(
+    host: str,
+    port: int,
+    **kwargs,
+) -> Connection:
+    """
+    Return a pooled RPyC connection, creating it on first use.
+
+    The pooled connection is health-checked before reuse; a dead one is
+    evicted and replaced transparently. Callers must not close the
+    returned connection (it is shared) — use close_pooled_connections()
+    for teardown.
+
+    Args:
+        host: Remote host address (IP or hostname)
+        port: Remote port number
+        **kwargs: Passed through to create_rpyc_connection on (re)connect
+
+    Returns:
+        A live RPyC connection
+
+    Raises:
+        RemoteConnectionError: If no connection can be established
+    """
+    key = (host, port)
+    with _pool_lock:
+        conn = _pool.get(key)
+        if conn is not None and test_connection(conn):
+            return conn
+        if conn is not None:
+            _pool.pop(key, None)
+            try:
+                conn.close()
+            except Exception:
+                pass
+        conn = create_rpyc_connection(host, port, **kwargs)
+        _pool[key] = conn
+        return conn
+
+
+def close_pooled_connections() -> None:
+    """Close and discard every pooled connection."""
+    with _pool_lock:
+        for conn in _pool.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        _pool.clear()
+
+
+def is_local_host(host: str) -> bool:
+    """
+    Check whether a host refers to this machine.
+
+    Used to decide when the shared-memory observation path can replace
+    the TCP socket: it applies not just to the loopback literals but
+    also to the machine's own hostname or LAN address, which is how
+    co-located setups are often configured.
+
+    Args:
+        host: Hostname or IP address as passed to create_rpyc_connection
+
+    Returns:
+        True if the host resolves to this machine
+    """
+    if host in ("localhost", "127.0.0.1", "::1"):
+        return True
+    try:
+        if host == socket.gethostname():
+            return True
+        host_ip = socket.gethostbyname(host)
+    except OSError:
+        return False
+    if host_ip.startswith("127."):
+        return True
+    try:
+        local_ips = {
+            info[4][0]
+            for info in socket.getaddrinfo(socket.gethostname(), None)
+        }
+    except OSError:
+        return False
+    return host_ip in local_ips
+
+
 def test_connection(conn: Connection) -> bool:
     """
     Test if an RPyC connection is alive and responsive.
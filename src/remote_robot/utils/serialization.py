@@ -4,13 +4,44 @@ Serialization utilities for efficient data transfer over RPyC.
 Handles encoding/decoding of observations, particularly image data.
 """
 
-import base64
 import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+# pybase64 is a drop-in with SIMD (SSSE3/AVX2 on x86, NEON on ARM)
+# encode/decode kernels — roughly 10x on the ~150 KB frames the base64
+# path still handles for older peers
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 import cv2
 import numpy as np
 
+# nvJPEG (pynvjpeg bindings) runs the whole JPEG pipeline on the GPU's
+# hardware engine, leaving the CPU to control and inference work —
+# relevant on Jetson-class servers and GPU teleop clients alike. One
+# persistent instance amortizes device and stream setup.
+try:
+    from nvjpeg import NvJpeg
+    _NJ = NvJpeg()
+except Exception:
+    _NJ = None
+
+# libjpeg-turbo runs the DCT and Huffman stages on SIMD kernels
+# (SSE2/AVX2 on x86, NEON on ARM), typically several times faster than
+# the libjpeg bundled with OpenCV; optional, with cv2 as the fallback.
+# One persistent instance amortizes library init and reuses its internal
+# compression buffers; it is thread-safe for concurrent encode/decode.
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _TJ = TurboJPEG()
+except Exception:
+    _TJ = None
+
 
 def encode_image(image: np.ndarray, format: str = ".jpg", quality: int = 90) -> str:
     """
@@ -24,77 +55,439 @@ def encode_image(image: np.ndarray, format: str = ".jpg", quality: int = 90) ->
     Returns:
         Base64-encoded image string
     """
+    jpg_bytes = encode_image_bytes(image, format=format, quality=quality)
+    jpg_b64 = base64.b64encode(jpg_bytes).decode('ascii')
+    return jpg_b64
+
+
+# Hoisted flag constant plus per-quality parameter lists: only a
+# handful of qualities are ever used, so the cv2 path stops allocating
+# a fresh list (and re-resolving the module attribute) per frame
+_JPEG_QUALITY_FLAG = int(cv2.IMWRITE_JPEG_QUALITY)
+_JPEG_PARAMS: dict = {}
+
+
+def _encode_jpg(image: np.ndarray, quality: int) -> bytes:
+    """Single JPEG encode through the fastest available codec.
+
+    Codec ladder: GPU hardware engine, then SIMD turbo, then cv2.
+    """
+    if _NJ is not None:
+        return _NJ.encode(image, quality)
+    if _TJ is not None:
+        return _TJ.encode(image, quality=quality, pixel_format=TJPF_BGR)
+    params = _JPEG_PARAMS.get(quality)
+    if params is None:
+        params = [_JPEG_QUALITY_FLAG, int(quality)]
+        _JPEG_PARAMS[quality] = params
+    success, encoded_image = cv2.imencode(".jpg", image, params)
+    if not success:
+        raise ValueError("Failed to encode image to .jpg")
+    return encoded_image.tobytes()
+
+
+# Adaptive-quality state per frame size: [quality, frames since the
+# last calibration]. JPEG output size is content-dependent, so the
+# chosen quality is re-derived every _ADAPT_RECAL frames rather than
+# paying a probe encode per frame.
+_ADAPT_Q: dict = {}
+_ADAPT_RECAL = 30
+
+
+def _encode_jpg_adaptive(image: np.ndarray, quality: int, target_bytes: int) -> bytes:
+    """Encode toward a bytes-per-frame budget.
+
+    On calibration frames, encode at the baseline quality, then scale
+    quality by the square root of the budget ratio (JPEG size grows
+    roughly linearly in quality over the useful range) and clamp to
+    [50, 95]; in-between frames reuse the cached quality directly.
+    """
+    key = image.shape[:2]
+    entry = _ADAPT_Q.get(key)
+    if entry is not None and entry[1] < _ADAPT_RECAL:
+        entry[1] += 1
+        return _encode_jpg(image, entry[0])
+
+    probe = _encode_jpg(image, quality)
+    scaled = round(quality * (target_bytes / max(len(probe), 1)) ** 0.5)
+    adapted = min(95, max(50, scaled))
+    _ADAPT_Q[key] = [adapted, 0]
+    if len(probe) <= target_bytes:
+        # Already within budget: ship the probe instead of re-encoding
+        return probe
+    return _encode_jpg(image, adapted)
+
+
+def encode_image_bytes(
+    image: np.ndarray,
+    format: str = ".jpg",
+    quality: int = 80,
+    target_bytes: "int | None" = None,
+) -> bytes:
+    """
+    Encode a numpy image array to compressed bytes (no base64 wrapper).
+
+    Args:
+        image: Image as numpy array (HxWxC)
+        format: Image format ('.jpg' or '.png')
+        quality: JPEG quality (0-100), ignored for PNG
+        target_bytes: Optional bytes-per-frame budget; when set, JPEG
+            quality adapts toward it (clamped to [50, 95]) instead of
+            staying fixed
+
+    Returns:
+        Compressed image bytes
+    """
     if format == ".jpg":
-        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
-    else:
-        encode_param = []
+        if target_bytes is not None:
+            return _encode_jpg_adaptive(image, quality, target_bytes)
+        return _encode_jpg(image, quality)
 
-    success, encoded_image = cv2.imencode(format, image, encode_param)
+    success, encoded_image = cv2.imencode(format, image, [])
     if not success:
         raise ValueError(f"Failed to encode image to {format}")
 
-    jpg_bytes = encoded_image.tobytes()
-    jpg_b64 = base64.b64encode(jpg_bytes).decode('utf-8')
-    return jpg_b64
+    return encoded_image.tobytes()
 
 
-def decode_image(encoded_str: str) -> np.ndarray:
+def decode_image(encoded: "str | bytes") -> np.ndarray:
     """
-    Decode a base64 image string to numpy array.
+    Decode a base64 image string or raw compressed bytes to numpy array.
 
     Args:
-        encoded_str: Base64-encoded image string
+        encoded: Base64-encoded image string, or raw JPEG/PNG bytes
 
     Returns:
         Image as numpy array (HxWxC) in BGR format
     """
-    jpg_bytes = base64.b64decode(encoded_str)
+    if isinstance(encoded, (bytes, bytearray, memoryview)):
+        # Keep the buffer as received: frombuffer and TurboJPEG read it
+        # through the buffer protocol, so a bytearray or memoryview from
+        # the transport needs no defensive copy here
+        jpg_bytes = encoded
+    else:
+        # validate=True keeps pybase64 on its SIMD path: without it the
+        # decoder must first strip non-alphabet characters in a scalar
+        # pre-pass. Our payloads come from encode_image, so the strict
+        # alphabet always holds.
+        jpg_bytes = base64.b64decode(encoded, validate=True)
+
+    # The fast codecs only speak JPEG; route PNG (or anything else)
+    # through cv2
+    if bytes(jpg_bytes[:2]) == b"\xff\xd8":
+        if _NJ is not None:
+            return _NJ.decode(
+                jpg_bytes if isinstance(jpg_bytes, bytes) else bytes(jpg_bytes)
+            )
+        if _TJ is not None:
+            return _TJ.decode(jpg_bytes, pixel_format=TJPF_BGR)
+
     jpg_array = np.frombuffer(jpg_bytes, dtype=np.uint8)
     image = cv2.imdecode(jpg_array, cv2.IMREAD_COLOR)
 
     if image is None:
-        raise ValueError("Failed to decode image from base64 string")
+        raise ValueError("Failed to decode image data")
 
     return image
 
 
-def encode_observation(obs: dict[str, Any]) -> dict[str, Any]:
+def encode_image_grid(
+    images: dict[str, np.ndarray], quality: int = 80
+) -> dict[str, Any]:
+    """
+    Tile several images into one canvas and encode a single JPEG.
+
+    Each JPEG payload carries ~600 bytes of header and Huffman/quant
+    tables; tiling N cameras into one frame pays that once and issues
+    one codec call instead of N. The entry remembers each image's box
+    so decoding returns per-camera views without copies.
+
+    Args:
+        images: Mapping of observation keys to HxWx3 uint8 arrays
+        quality: JPEG quality (0-100)
+
+    Returns:
+        A tagged "image_grid" entry; decode_observation flattens it
+        back into one entry per original key
+    """
+    height = max(image.shape[0] for image in images.values())
+    width = sum(image.shape[1] for image in images.values())
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+    boxes = {}
+    x = 0
+    for key, image in images.items():
+        h, w = image.shape[:2]
+        canvas[:h, x:x + w] = image
+        boxes[key] = (0, x, h, w)
+        x += w
+    return {
+        "__type__": "image_grid",
+        "data": _encode_jpg(canvas, quality),
+        "boxes": boxes,
+    }
+
+
+def _decode_image_grid(value: dict[str, Any]) -> dict[str, np.ndarray]:
+    """Decode a grid entry into per-key views over one decoded canvas."""
+    canvas = decode_image(value["data"])
+    return {
+        key: canvas[y:y + h, x:x + w]
+        for key, (y, x, h, w) in value["boxes"].items()
+    }
+
+
+# dtype objects hash fast, but str(dtype) builds a fresh string per
+# call; caching the interned form means the dict values pickled every
+# frame are the same objects, so pickle memoizes them instead of
+# re-serializing the characters.
+_DTYPE_STR: dict = {}
+
+
+def _dtype_str(dtype) -> str:
+    """Interned string form of a numpy dtype, cached per dtype."""
+    s = _DTYPE_STR.get(dtype)
+    if s is None:
+        s = sys.intern(str(dtype))
+        _DTYPE_STR[dtype] = s
+    return s
+
+
+def _encode_image_b64(value: np.ndarray) -> dict[str, Any]:
+    """Image entry with base64 JPEG payload."""
+    return {
+        "__type__": "image",
+        "data": encode_image(value),
+        "shape": value.shape,
+        "dtype": _dtype_str(value.dtype),
+    }
+
+
+def _encode_image_bin(value: np.ndarray) -> dict[str, Any]:
+    """Image entry with raw JPEG bytes payload."""
+    return {
+        "__type__": "image",
+        "data": encode_image_bytes(value),
+        "shape": value.shape,
+        "dtype": _dtype_str(value.dtype),
+    }
+
+
+def _encode_array_bin(value: np.ndarray) -> dict[str, Any]:
+    """Array entry as raw buffer + shape/dtype: one memcpy instead of a
+    Python list round-trip per element."""
+    return {
+        "__type__": "array_bytes",
+        "data": value.tobytes(),
+        "shape": tuple(value.shape),
+        "dtype": _dtype_str(value.dtype),
+    }
+
+
+def _encode_array_list(value: np.ndarray) -> dict[str, Any]:
+    """Array entry as nested lists (base64-era compatible form)."""
+    return {
+        "__type__": "array",
+        "data": value.tolist(),
+        "shape": value.shape,
+        "dtype": _dtype_str(value.dtype),
+    }
+
+
+def _passthrough(value: Any) -> Any:
+    """Identity encoder for scalars and other plain values."""
+    return value
+
+
+# When client and server share a host (e.g. a training process bridged
+# to a local robot server), REMOTE_ROBOT_SHM_DIR points both at a
+# tmpfs directory (typically under /dev/shm) and images travel as
+# memmap files instead of socket payloads: only path/shape/dtype cross
+# the wire, so the frame itself is never copied through the network
+# stack or JPEG codec.
+_SHM_DIR = os.environ.get("REMOTE_ROBOT_SHM_DIR")
+
+# Writer-side memmaps, kept open per path so steady-state encoding is a
+# single memcpy into the mapping rather than an open+mmap per frame.
+_shm_maps: dict = {}
+
+
+def _make_shm_encoder(key: str):
+    """Build an encoder that writes image arrays to a shared memmap.
+
+    One file per observation key, overwritten in place each frame;
+    intended for a single co-located reader, matching the drop-oldest
+    semantics of the other frame paths.
+    """
+    path = os.path.join(_SHM_DIR, key.replace(os.sep, "_") + ".raw")
+
+    def _encode(value: np.ndarray) -> dict[str, Any]:
+        mm = _shm_maps.get(path)
+        if mm is None or mm.shape != value.shape or mm.dtype != value.dtype:
+            mm = np.memmap(path, mode="w+", dtype=value.dtype, shape=value.shape)
+            _shm_maps[path] = mm
+        mm[:] = value
+        return {
+            "__type__": "shm",
+            "path": path,
+            "shape": tuple(value.shape),
+            "dtype": _dtype_str(value.dtype),
+        }
+
+    return _encode
+
+
+def _resolve_encoder(key: str, value: Any, binary_images: bool):
+    """Pick the per-entry encoder for a value (full type dispatch)."""
+    if isinstance(value, np.ndarray):
+        if value.ndim == 3:  # Image: (H, W, C)
+            if _SHM_DIR:
+                return _make_shm_encoder(key)
+            return _encode_image_bin if binary_images else _encode_image_b64
+        if binary_images:
+            return _encode_array_bin
+        return _encode_array_list
+    return _passthrough
+
+
+# Shared worker pool for multi-camera codecs. cv2, TurboJPEG and nvJPEG
+# all release the GIL while compressing, so encoding/decoding several
+# frames in parallel scales near-linearly with cores. Created lazily:
+# single-camera robots never spawn the threads.
+_JPEG_POOL = None
+
+
+def _jpeg_pool() -> ThreadPoolExecutor:
+    global _JPEG_POOL
+    if _JPEG_POOL is None:
+        _JPEG_POOL = ThreadPoolExecutor(
+            max_workers=min(6, os.cpu_count() or 1),
+            thread_name_prefix="jpeg",
+        )
+    return _JPEG_POOL
+
+
+# Whole-schema specialization: one closure per (mode, key set) that
+# walks a prebuilt (key, encoder) list. The observation schema is fixed
+# per robot, so the isinstance/ndim dispatch runs once on the first
+# frame; steady-state encoding is then a single dict comprehension of
+# straight-line calls, with no per-key cache lookups or tuple
+# allocations in the loop.
+_schema_encoders: dict = {}
+
+
+def _specialize_schema(obs: dict[str, Any], binary_images: bool):
+    """Build the specialized encoder closure for an observation schema.
+
+    Schemas with two or more images get a variant that farms the image
+    compression out to the shared pool while the cheap entries are
+    encoded inline, overlapping the per-camera JPEG work.
+    """
+    pairs = [
+        (key, _resolve_encoder(key, value, binary_images))
+        for key, value in obs.items()
+    ]
+    # Scalar-only schemas (no cameras configured) marshal fine as-is:
+    # hand the dict back without rebuilding it
+    if all(encoder is _passthrough for _, encoder in pairs):
+        return _passthrough
+
+    image_encoders = (_encode_image_bin, _encode_image_b64)
+    image_pairs = tuple(p for p in pairs if p[1] in image_encoders)
+    other_pairs = tuple(p for p in pairs if p[1] not in image_encoders)
+
+    if len(image_pairs) < 2:
+
+        def _encode(o: dict[str, Any], _pairs=tuple(pairs)) -> dict[str, Any]:
+            return {key: encoder(o[key]) for key, encoder in _pairs}
+
+        return _encode
+
+    def _encode_parallel(o: dict[str, Any]) -> dict[str, Any]:
+        pool = _jpeg_pool()
+        futures = [
+            (key, pool.submit(encoder, o[key])) for key, encoder in image_pairs
+        ]
+        out = {key: encoder(o[key]) for key, encoder in other_pairs}
+        for key, future in futures:
+            out[key] = future.result()
+        return out
+
+    return _encode_parallel
+
+
+def encode_observation(obs: dict[str, Any], binary_images: bool = True) -> dict[str, Any]:
     """
     Encode an observation dictionary for network transfer.
 
-    Images (numpy arrays with 3 dimensions) are encoded to base64 strings.
-    Other values are passed through unchanged.
+    Images (numpy arrays with 3 dimensions) are encoded to raw JPEG
+    bytes; RPyC carries bytes natively, so the base64 wrapper (33%
+    inflation plus a full byte-scan pass each way) is only worth paying
+    for peers that need text-safe payloads — pass binary_images=False
+    for those. Other values are passed through unchanged. With
+    REMOTE_ROBOT_SHM_DIR set, images are written to shared memmap files
+    instead and only their path/shape/dtype are returned (see _SHM_DIR).
+
+    Values are dispatched through a specialized encoder built once per
+    schema (mode plus key set) and reused for every later frame; the
+    schema is assumed stable for a given robot within a process, which
+    holds for every robot in this codebase.
 
     Args:
         obs: Observation dictionary from robot.get_observation()
+        binary_images: Encode images as raw JPEG bytes (default) rather
+            than base64 strings
 
     Returns:
         Encoded observation dictionary safe for RPyC transfer
     """
-    encoded = {}
-    for key, value in obs.items():
-        if isinstance(value, np.ndarray):
-            if value.ndim == 3:  # Image: (H, W, C)
-                encoded[key] = {
-                    "__type__": "image",
-                    "data": encode_image(value),
-                    "shape": value.shape,
-                    "dtype": str(value.dtype),
-                }
-            else:  # Other arrays (scalars, vectors, etc.)
-                encoded[key] = {
-                    "__type__": "array",
-                    "data": value.tolist(),
-                    "shape": value.shape,
-                    "dtype": str(value.dtype),
-                }
-        elif isinstance(value, (float, int, bool)):
-            encoded[key] = value
-        else:
-            # Pass through other types
-            encoded[key] = value
-
-    return encoded
+    schema = (binary_images, tuple(obs))
+    encode = _schema_encoders.get(schema)
+    if encode is None:
+        encode = _specialize_schema(obs, binary_images)
+        _schema_encoders[schema] = encode
+    return encode(obs)
+
+
+def _decode_shm(value: dict[str, Any]) -> np.ndarray:
+    """Decode a shared-memmap image entry (see _make_shm_encoder)."""
+    mm = np.memmap(
+        value["path"],
+        mode="r",
+        dtype=np.dtype(value["dtype"]),
+        shape=tuple(value["shape"]),
+    )
+    # Copy out so the caller owns the frame; the writer overwrites
+    # the mapping on the next capture
+    return np.array(mm)
+
+
+def _decode_array_bytes(value: dict[str, Any]) -> np.ndarray:
+    """Decode a buffer-transport array entry as a view over its data."""
+    data = value["data"]
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data)  # materialize netref values once
+    # frombuffer + reshape are views over the received buffer: no
+    # per-element objects, no extra copy
+    return np.frombuffer(data, dtype=np.dtype(value["dtype"])).reshape(
+        tuple(value["shape"])
+    )
+
+
+def _decode_array_list(value: dict[str, Any]) -> np.ndarray:
+    """Decode a nested-list array entry (base64-era compatible form)."""
+    return np.array(value["data"], dtype=np.dtype(value["dtype"]))
+
+
+# Tag-dispatch table for decode_observation: one dict lookup per tagged
+# entry replaces the chain of string comparisons that an if/elif ladder
+# re-evaluates top to bottom per key per frame. Images are absent here
+# on purpose — they are deferred for batched (possibly parallel)
+# decoding below.
+_TAG_DECODERS = {
+    "shm": _decode_shm,
+    "array_bytes": _decode_array_bytes,
+    "array": _decode_array_list,
+}
 
 
 def decode_observation(encoded: dict[str, Any]) -> dict[str, Any]:
@@ -107,16 +500,49 @@ def decode_observation(encoded: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Original observation dictionary with numpy arrays restored
     """
+    # Scalar-only payloads (the encode-side identity fast path) carry
+    # no tagged entries: hand them back without rebuilding the dict.
+    # Only a genuine local dict may be returned as-is — an RPyC netref
+    # would cost a round trip per key access and die with the
+    # connection, so anything else is materialized into a local copy.
+    if not any(
+        isinstance(value, dict) and "__type__" in value
+        for value in encoded.values()
+    ):
+        if type(encoded) is dict:
+            return encoded
+        return dict(encoded)
+
     decoded = {}
+    # Deferred image payloads: with several cameras the JPEG decodes
+    # run on the shared pool in parallel (the codecs release the GIL)
+    image_items = []
     for key, value in encoded.items():
         if isinstance(value, dict) and "__type__" in value:
-            if value["__type__"] == "image":
-                decoded[key] = decode_image(value["data"])
-            elif value["__type__"] == "array":
-                decoded[key] = np.array(value["data"], dtype=np.dtype(value["dtype"]))
+            tag = value["__type__"]
+            if tag == "image":
+                image_items.append((key, value["data"]))
+            elif tag == "image_grid":
+                # One decode for the whole tile; entries land under
+                # their original keys as views
+                decoded.update(_decode_image_grid(value))
+            else:
+                handler = _TAG_DECODERS.get(tag)
+                if handler is not None:
+                    decoded[key] = handler(value)
         else:
             decoded[key] = value
 
+    if len(image_items) >= 2:
+        results = _jpeg_pool().map(
+            decode_image, [data for _, data in image_items]
+        )
+        for (key, _), image in zip(image_items, results):
+            decoded[key] = image
+    elif image_items:
+        key, data = image_items[0]
+        decoded[key] = decode_image(data)
+
     return decoded
 
 
@@ -124,7 +550,9 @@ def encode_action(action: dict[str, Any]) -> dict[str, Any]:
     """
     Encode an action dictionary for network transfer.
 
-    Converts numpy arrays to lists for JSON serialization.
+    Array-valued entries travel as float32 buffers: commands are float32
+    precision at best anyway, and a tolist() pass would allocate one
+    Python float64 per element at control rate. Scalars pass through.
 
     Args:
         action: Action dictionary to send to robot
@@ -135,7 +563,11 @@ def encode_action(action: dict[str, Any]) -> dict[str, Any]:
     encoded = {}
     for key, value in action.items():
         if isinstance(value, np.ndarray):
-            encoded[key] = value.tolist()
+            encoded[key] = {
+                "__type__": "f32",
+                "data": np.ascontiguousarray(value, dtype=np.float32).tobytes(),
+                "shape": tuple(value.shape),
+            }
         else:
             encoded[key] = value
 
@@ -150,7 +582,29 @@ def decode_action(encoded: dict[str, Any]) -> dict[str, Any]:
         encoded: Encoded action from encode_action()
 
     Returns:
-        Original action dictionary (passes through as-is)
+        Original action dictionary with float32 arrays restored
     """
-    # Actions are typically simple floats, no decoding needed
-    return encoded
+    # Scalar-only actions (the common case) pass through untouched;
+    # same netref guard as decode_observation — only a local dict is
+    # safe to hand back by reference
+    if not any(
+        isinstance(value, dict) and value.get("__type__") == "f32"
+        for value in encoded.values()
+    ):
+        if type(encoded) is dict:
+            return encoded
+        return dict(encoded)
+
+    decoded = {}
+    for key, value in encoded.items():
+        if isinstance(value, dict) and value.get("__type__") == "f32":
+            data = value["data"]
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                data = bytes(data)
+            decoded[key] = np.frombuffer(data, dtype="<f4").reshape(
+                tuple(value["shape"])
+            )
+        else:
+            decoded[key] = value
+
+    return decoded
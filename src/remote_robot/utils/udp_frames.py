@@ -0,0 +1,121 @@
+"""
+UDP side-channel for camera frames.
+
+Shipping image payloads on the RPyC TCP stream means a delayed frame
+stalls every small control RPC queued behind it (head-of-line blocking).
+This module moves frames onto their own UDP flow: the server pushes the
+newest encoded frame as sequenced datagrams and the client keeps the
+latest fully reassembled one, dropping anything stale or incomplete.
+Loss costs a frame, never a control message.
+"""
+
+import socket
+import struct
+import threading
+from typing import Optional
+
+# Fragment header: sequence number, fragment index, fragment count
+_HEADER = struct.Struct("!IHH")
+# Payload bytes per datagram, kept safely under the 65507-byte UDP limit
+_CHUNK = 60000
+
+
+class UdpFrameSender:
+    """Pushes frame payloads to a client address as sequenced datagrams."""
+
+    def __init__(self, host: str, port: int):
+        """
+        Args:
+            host: Destination address of the receiving client
+            port: Destination UDP port
+        """
+        self._addr = (host, port)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._seq = 0
+
+    def send(self, payload: bytes) -> None:
+        """
+        Send one frame payload, fragmented if needed.
+
+        Args:
+            payload: Encoded frame bytes (any size)
+        """
+        self._seq = (self._seq + 1) & 0xFFFFFFFF
+        fragments = [
+            payload[offset:offset + _CHUNK]
+            for offset in range(0, len(payload), _CHUNK)
+        ] or [b""]
+        total = len(fragments)
+        for index, fragment in enumerate(fragments):
+            self._sock.sendto(
+                _HEADER.pack(self._seq, index, total) + fragment, self._addr
+            )
+
+    def close(self) -> None:
+        """Close the underlying socket."""
+        self._sock.close()
+
+
+class UdpFrameReceiver:
+    """
+    Reassembles sequenced datagrams and keeps only the newest frame.
+
+    A background thread drains the socket; partial or out-of-date
+    sequences are discarded, so latest() never blocks on the network.
+    """
+
+    def __init__(self, port: int = 0):
+        """
+        Args:
+            port: UDP port to bind (0 picks a free one; see .port)
+        """
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("", port))
+        self._sock.settimeout(0.25)
+        self._lock = threading.Lock()
+        self._latest: Optional[bytes] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        """The bound UDP port to hand to the sender."""
+        return self._sock.getsockname()[1]
+
+    def _drain(self) -> None:
+        pending_seq = -1
+        fragments: dict = {}
+        expected = 0
+        while not self._stop.is_set():
+            try:
+                datagram, _ = self._sock.recvfrom(_CHUNK + _HEADER.size)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            seq, index, total = _HEADER.unpack_from(datagram)
+            if seq != pending_seq:
+                # Newer (or wrapped) sequence: drop the partial frame
+                pending_seq = seq
+                fragments = {}
+                expected = total
+            fragments[index] = datagram[_HEADER.size:]
+            if len(fragments) == expected:
+                payload = b"".join(fragments[i] for i in range(expected))
+                with self._lock:
+                    self._latest = payload
+                fragments = {}
+                pending_seq = -1
+
+    def latest(self) -> Optional[bytes]:
+        """The newest complete frame payload, or None before the first."""
+        with self._lock:
+            return self._latest
+
+    def close(self) -> None:
+        """Stop the drain thread and close the socket."""
+        self._stop.set()
+        self._sock.close()
+        self._thread.join(timeout=0.5)
@@ -0,0 +1,149 @@
+"""
+Binary wire format for RPyC payloads.
+
+RPyC's brine serializer ships dicts with per-key overhead and proxies
+nested values through netrefs, which is expensive for observation and
+action payloads. Packing the whole payload into one bytes blob means
+brine only transfers a single bytestring per call.
+
+Uses msgspec's C msgpack encoder when installed; falls back to pickle
+(still a single blob, just slower to encode). A one-byte format tag
+lets either side decode blobs from a peer with a different encoder.
+"""
+
+import pickle
+import threading
+from typing import Any, Dict
+
+import numpy as np
+
+try:
+    import msgspec.msgpack
+except ImportError:
+    msgspec = None
+
+
+_TAG_MSGPACK = b"m"
+_TAG_PICKLE = b"p"
+
+# Encoder/Decoder instances are reused so each call amortizes their
+# internal buffers instead of allocating fresh ones; they are kept
+# per-thread because msgspec encoders are not safe for concurrent use
+# and the RPyC ThreadedServer serves each client from its own thread.
+_local = threading.local()
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Teach the msgpack encoder about numpy scalars.
+
+    Observation and action values frequently arrive as np.float32/64
+    rather than Python floats; item() converts them to the native
+    equivalent so payloads need no pre-normalization pass.
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot pack object of type {type(obj).__name__}")
+
+
+def _get_codec():
+    """Per-thread (Encoder, Decoder) pair, created on first use."""
+    codec = getattr(_local, "codec", None)
+    if codec is None:
+        codec = (
+            msgspec.msgpack.Encoder(enc_hook=_enc_hook),
+            msgspec.msgpack.Decoder(),
+        )
+        _local.codec = codec
+    return codec
+
+
+def pack(obj: Any) -> bytes:
+    """
+    Serialize a payload to a single tagged bytes blob.
+
+    Args:
+        obj: msgpack-compatible payload (dicts, scalars, bytes, lists)
+
+    Returns:
+        Format tag byte followed by the encoded payload
+    """
+    if msgspec is not None:
+        return _TAG_MSGPACK + _get_codec()[0].encode(obj)
+    return _TAG_PICKLE + pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def unpack(buf: bytes) -> Any:
+    """
+    Deserialize a bytes blob produced by pack().
+
+    Args:
+        buf: Tagged blob (accepts bytes-like netref values)
+
+    Returns:
+        The original payload
+
+    Raises:
+        ValueError: If the format tag is unknown
+    """
+    buf = bytes(buf)
+    tag, body = buf[:1], buf[1:]
+    if tag == _TAG_MSGPACK:
+        if msgspec is None:
+            raise ValueError("msgpack blob received but msgspec is not installed")
+        return _get_codec()[1].decode(body)
+    if tag == _TAG_PICKLE:
+        return pickle.loads(body)
+    raise ValueError(f"Unknown wire format tag: {tag!r}")
+
+
+# Feature dictionaries map names to types (float) or shape tuples; both
+# sides share this table so schemas can cross the wire as one packed
+# blob instead of a netref dict fetched key by key.
+_TYPE_CODES: Dict[str, type] = {
+    "float": float,
+    "int": int,
+    "bool": bool,
+    "str": str,
+}
+
+
+def pack_features(features: Dict[str, Any]) -> bytes:
+    """
+    Serialize a feature schema dict into a single packed blob.
+
+    Args:
+        features: Mapping of feature names to types or shape tuples
+
+    Returns:
+        Blob suitable for unpack_features()
+    """
+    encoded = {}
+    for key, value in features.items():
+        if isinstance(value, type):
+            encoded[key] = value.__name__
+        elif isinstance(value, tuple):
+            encoded[key] = list(value)
+        else:
+            encoded[key] = str(value)
+    return pack(encoded)
+
+
+def unpack_features(buf: bytes) -> Dict[str, Any]:
+    """
+    Restore a feature schema dict produced by pack_features().
+
+    Args:
+        buf: Packed schema blob
+
+    Returns:
+        Mapping of feature names to types or shape tuples
+    """
+    decoded = {}
+    for key, value in unpack(buf).items():
+        if isinstance(value, str) and value in _TYPE_CODES:
+            decoded[key] = _TYPE_CODES[value]
+        elif isinstance(value, list):
+            decoded[key] = tuple(value)
+        else:
+            decoded[key] = value
+    return decoded